@@ -0,0 +1,52 @@
+"""Add compound indexes for orders list queries
+
+Revision ID: compound_order_idx
+Revises: add_constraints_idx
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'compound_order_idx'
+down_revision = 'add_constraints_idx'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Replace single-column terminal/service indexes with compound ones.
+
+    Order lists are filtered by terminal or service and narrowed by ETA date,
+    so (terminal_id, eta_date) and (service, priority, eta_date) serve the
+    filter and the date range from one index. The compound indexes cover the
+    leftmost-prefix lookups of ix_orders_terminal_id and ix_orders_service,
+    which are dropped to save write amplification.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = '5s'")
+
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_terminal_eta ON orders (terminal_id, eta_date)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_service_priority_eta ON orders (service, priority, eta_date)")
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_orders_terminal_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_orders_service")
+
+        op.execute("RESET lock_timeout")
+
+
+def downgrade():
+    """Restore the single-column indexes and drop the compound ones."""
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = '5s'")
+
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_terminal_id ON orders (terminal_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_service ON orders (service)")
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_orders_terminal_eta")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_orders_service_priority_eta")
+
+        op.execute("RESET lock_timeout")
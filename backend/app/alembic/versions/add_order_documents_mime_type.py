@@ -0,0 +1,32 @@
+"""Store the MIME type of order documents
+
+Revision ID: order_docs_mime_type
+Revises: order_docs_created_idx
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'order_docs_mime_type'
+down_revision = 'order_docs_created_idx'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add a nullable mime_type column, filled when a document is uploaded.
+
+    Adding a nullable column without a default is a catalog-only change.
+    Existing rows stay NULL and are served with the type detected from the
+    file extension, as before.
+    """
+    op.add_column('order_documents', sa.Column('mime_type', sa.String(length=127), nullable=True))
+
+
+def downgrade():
+    """Drop the mime_type column."""
+    op.drop_column('order_documents', 'mime_type')
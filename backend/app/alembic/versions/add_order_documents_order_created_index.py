@@ -0,0 +1,57 @@
+"""Index order documents by order and creation time
+
+Revision ID: order_docs_created_idx
+Revises: compound_order_idx
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'order_docs_created_idx'
+down_revision = 'compound_order_idx'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Serve "documents of an order, newest first" from a single index.
+
+    (order_id, created_at DESC NULLS LAST) replaces the separate order_id and
+    created_at indexes, so listing an order's documents needs no sort step.
+    created_at gets a now() default so new documents are actually ordered by
+    upload time; existing rows keep NULL and are listed after them.
+    The type index is kept because documents can be filtered by type.
+    """
+    op.execute("ALTER TABLE order_documents ALTER COLUMN created_at SET DEFAULT now()")
+
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = '5s'")
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_order_documents_order_created "
+            "ON order_documents (order_id, created_at DESC NULLS LAST)"
+        )
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_order_documents_order_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_order_documents_created_at")
+
+        op.execute("RESET lock_timeout")
+
+
+def downgrade():
+    """Restore the single-column indexes and drop the compound one."""
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = '5s'")
+
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_order_documents_order_id ON order_documents (order_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_order_documents_created_at ON order_documents (created_at)")
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_order_documents_order_created")
+
+        op.execute("RESET lock_timeout")
+
+    op.execute("ALTER TABLE order_documents ALTER COLUMN created_at DROP DEFAULT")
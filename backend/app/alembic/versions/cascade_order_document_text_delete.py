@@ -0,0 +1,40 @@
+"""Delete the text row of an order document together with the document
+
+Revision ID: order_doc_text_cascade
+Revises: order_docs_mime_type
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'order_doc_text_cascade'
+down_revision = 'order_docs_mime_type'
+branch_label = None
+depends_on = None
+
+
+# Name Postgres gave the unnamed foreign key of the initial migration
+FK_NAME = 'order_document_text_order_document_id_fkey'
+
+
+def upgrade():
+    """
+    Recreate order_document_text.order_document_id with ON DELETE CASCADE,
+    so deleting an order document removes its text row in the same statement.
+    """
+    op.drop_constraint(FK_NAME, 'order_document_text', type_='foreignkey')
+    op.create_foreign_key(
+        FK_NAME, 'order_document_text', 'order_documents',
+        ['order_document_id'], ['id'], ondelete='CASCADE',
+    )
+
+
+def downgrade():
+    """Restore the foreign key without ON DELETE CASCADE."""
+    op.drop_constraint(FK_NAME, 'order_document_text', type_='foreignkey')
+    op.create_foreign_key(
+        FK_NAME, 'order_document_text', 'order_documents',
+        ['order_document_id'], ['id'],
+    )
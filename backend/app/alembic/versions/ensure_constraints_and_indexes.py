@@ -0,0 +1,83 @@
+"""Build missing constraint indexes concurrently and validate CHECK constraints
+
+Revision ID: ensure_constraints_idx
+Revises: order_doc_text_cascade
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ensure_constraints_idx'
+down_revision = 'order_doc_text_cascade'
+branch_label = None
+depends_on = None
+
+
+# (index name, table, column) from add_constraints_idx; the order_id and
+# created_at indexes of order_documents were replaced by order_docs_created_idx
+INDEXES = [
+    ('ix_orders_eta_date', 'orders', 'eta_date'),
+    ('ix_orders_etd_date', 'orders', 'etd_date'),
+    ('ix_orders_created_at', 'orders', 'created_at'),
+    ('ix_orders_terminal_id', 'orders', 'terminal_id'),
+    ('ix_orders_service', 'orders', 'service'),
+    ('ix_orders_priority', 'orders', 'priority'),
+    ('ix_order_documents_type', 'order_documents', 'type'),
+    ('ix_terminals_name', 'terminals', 'name'),
+    ('ix_terminals_account_code', 'terminals', 'account_code'),
+    ('ix_drivers_name', 'drivers', 'name'),
+    ('ix_drivers_phone', 'drivers', 'phone'),
+    ('ix_trucks_license_plate', 'trucks', 'license_plate'),
+    ('ix_trailers_license_plate', 'trailers', 'license_plate'),
+]
+
+# (constraint name, table, condition) from add_constraints_idx
+CHECK_CONSTRAINTS = [
+    ('ck_orders_positive_pallets', 'orders', 'pallets IS NULL OR pallets >= 0'),
+    ('ck_orders_positive_boxes', 'orders', 'boxes IS NULL OR boxes >= 0'),
+    ('ck_orders_positive_kilos', 'orders', 'kilos IS NULL OR kilos >= 0'),
+]
+
+
+def upgrade():
+    """
+    Make sure every index and CHECK constraint of add_constraints_idx exists.
+
+    add_constraints_idx is already applied in deployed databases and stays as
+    released. This revision only creates what is missing there, without
+    blocking writers: indexes are built CONCURRENTLY (outside a transaction,
+    hence the autocommit block), and CHECK constraints are added NOT VALID and
+    validated afterwards, which only needs a lock that lets reads and writes
+    continue. Tables that do not exist (trucks, trailers) are skipped.
+    """
+    with op.get_context().autocommit_block():
+        # Fail fast instead of queueing behind long-running transactions
+        op.execute("SET lock_timeout = '5s'")
+
+        inspector = sa.inspect(op.get_bind())
+        for index_name, table, column in INDEXES:
+            if inspector.has_table(table):
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} ({column})")
+
+        existing_constraints = {
+            constraint['name'] for constraint in inspector.get_check_constraints('orders')
+        }
+        for constraint_name, table, condition in CHECK_CONSTRAINTS:
+            if constraint_name not in existing_constraints:
+                op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {constraint_name} CHECK ({condition}) NOT VALID")
+        # A no-op for constraints that are already valid
+        for constraint_name, table, _ in CHECK_CONSTRAINTS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint_name}")
+
+        op.execute("RESET lock_timeout")
+
+
+def downgrade():
+    """
+    Nothing to undo: the indexes and constraints belong to add_constraints_idx,
+    whose downgrade drops them.
+    """
+    pass
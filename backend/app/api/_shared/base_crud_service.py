@@ -1,14 +1,29 @@
 import uuid
-from typing import Generic, TypeVar, Type, Tuple, Any
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from typing import Generic, TypeVar, Type, Tuple, Any, Optional
 
-from app.utils.queries.fetching import fetch_all, fetch_count_query, fetch_one_or_404
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, text
+
+from app.utils.queries.fetching import (
+    fetch_all,
+    fetch_all_with_count,
+    fetch_count_query,
+    fetch_one_or_404,
+    fetch_row_or_404,
+)
 from app.utils.queries.queries import apply_filter_sort_range_for_query
 
 T = TypeVar('T')  # Model type
 Q = TypeVar('Q')  # QueryParams type
 
+# Planner row estimate maintained by ANALYZE/autovacuum, O(1) to read
+ESTIMATED_COUNT_QUERY = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)")
+
+# Planner estimates by table name, kept per worker process for a minute so unfiltered
+# lists do not pay an extra pg_class round-trip on every request
+_estimated_counts: TTLCache = TTLCache(maxsize=128, ttl=60)
+
 
 class BaseCRUDService(Generic[T, Q]):
     """
@@ -25,6 +40,18 @@ class BaseCRUDService(Generic[T, Q]):
 
     model: Type[T]
 
+    # Order in which filter fields are applied, lowest first (unlisted fields: 100)
+    filter_priority: dict[str, int] = {}
+
+    # Columns selected by get_by_id; empty selects the whole entity. Set it to the
+    # columns the detail response reads: a plain row skips ORM instance and
+    # identity-map bookkeeping, and wide tables send fewer bytes.
+    get_by_id_columns: Tuple[Any, ...] = ()
+
+    # Unfiltered lists on tables estimated above this size report the planner
+    # estimate as total instead of counting every row
+    EXACT_COUNT_THRESHOLD: int = 10_000
+
     def __init__(self, db: AsyncSession):
         """
         Initialize the service with a database session.
@@ -38,26 +65,68 @@ class BaseCRUDService(Generic[T, Q]):
         """
         Fetch all records with optional filtering, sorting, and pagination.
 
+        Without a filter, tables larger than ``EXACT_COUNT_THRESHOLD`` report
+        the planner estimate from ``pg_class`` (cached briefly) as total. Otherwise the total
+        count is computed with a ``count() OVER ()`` window column so rows and
+        total come back in a single round-trip. The separate count query is
+        only executed when the requested range is past the last row.
+
         Args:
             querystring: Query parameters containing filter, sort, and range options
 
         Returns:
             Tuple of (list of records, total count)
         """
-        select_query = select(self.model)
         count_query = select(func.count()).select_from(self.model)
 
+        if not querystring.filter:
+            estimated_count = await self._fast_count()
+            if estimated_count is not None:
+                query, _ = apply_filter_sort_range_for_query(
+                    self.model,
+                    select(self.model),
+                    count_query,
+                    querystring.dict_data,
+                    filter_priority=self.filter_priority,
+                )
+                items = await fetch_all(self.db, query)
+                return items, estimated_count
+
+        select_query = select(self.model, func.count().over().label("total_count"))
+
         query, count_query = apply_filter_sort_range_for_query(
             self.model,
             select_query,
             count_query,
             querystring.dict_data,
+            filter_priority=self.filter_priority,
         )
 
-        items = await fetch_all(self.db, query)
-        count = await fetch_count_query(self.db, count_query)
+        items, count = await fetch_all_with_count(self.db, query)
+        if not items and querystring.range and querystring.range[0]:
+            count = await fetch_count_query(self.db, count_query)
         return items, count
 
+    async def _fast_count(self) -> Optional[int]:
+        """
+        Estimate the number of rows in the model's table from planner statistics.
+        The estimate is cached for a minute, so this usually costs no query.
+
+        Returns:
+            The estimated row count, or None when the table is smaller than
+            ``EXACT_COUNT_THRESHOLD`` (or has never been analyzed) and an exact
+            count should be used instead
+        """
+        table_name = self.model.__tablename__
+        if table_name in _estimated_counts:
+            estimated_count = _estimated_counts[table_name]
+        else:
+            result = await self.db.execute(ESTIMATED_COUNT_QUERY.bindparams(table_name=table_name))
+            estimated_count = _estimated_counts[table_name] = result.scalar()
+        if estimated_count is None or estimated_count < self.EXACT_COUNT_THRESHOLD:
+            return None
+        return estimated_count
+
     async def get_by_id(self, id: uuid.UUID) -> T:
         """
         Retrieve a single record by its ID.
@@ -66,11 +135,20 @@ class BaseCRUDService(Generic[T, Q]):
             id: UUID of the record to retrieve
 
         Returns:
-            The requested record
+            The requested record, or a row with only ``get_by_id_columns``
+            when the service defines them
 
         Raises:
             HTTPException: 404 if record not found
         """
+        if self.get_by_id_columns:
+            query = select(*self.get_by_id_columns).where(self.model.id == id)
+            return await fetch_row_or_404(
+                self.db,
+                query,
+                detail=f"{self.model.__name__} not found"
+            )
+
         query = select(self.model).where(self.model.id == id)
         item = await fetch_one_or_404(
             self.db,
@@ -1,18 +1,40 @@
 """Health check endpoints for monitoring application status."""
 
+import asyncio
 import logging
+import time
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from pydantic import BaseModel
 
 from app.database.conn import get_db
-from app.modules.redis import REDIS_CLIENT
+from app.modules.redis import ASYNC_REDIS_CLIENT
 
 logger = logging.getLogger(__name__)
 
 health_router = APIRouter(tags=["health"])
 
+_SELECT_1 = text("SELECT 1")
+
+
+class _ReadyCache:
+    """Remembers the last successful readiness check for a short time."""
+
+    TTL = 1.0
+
+    def __init__(self):
+        self.last_ok_ts = float("-inf")
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.last_ok_ts < self.TTL
+
+    def mark_ok(self) -> None:
+        self.last_ok_ts = time.monotonic()
+
+
+_READY_CACHE = _ReadyCache()
+
 
 class HealthStatus(BaseModel):
     """Health status response model."""
@@ -20,6 +42,24 @@ class HealthStatus(BaseModel):
     checks: dict = {}
 
 
+async def _check_dependencies(db: AsyncSession) -> dict[str, BaseException | None]:
+    """
+    Check database and Redis connectivity concurrently.
+
+    Returns:
+        Mapping of dependency name to the raised exception, or None if it is available
+    """
+    results = await asyncio.gather(
+        db.execute(_SELECT_1),
+        ASYNC_REDIS_CLIENT.ping(),
+        return_exceptions=True,
+    )
+    return {
+        name: result if isinstance(result, BaseException) else None
+        for name, result in zip(("database", "redis"), results)
+    }
+
+
 @health_router.get("/health", response_model=HealthStatus)
 async def health_check():
     """
@@ -37,25 +77,14 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)):
     """
     health_status = HealthStatus(status="ok", checks={})
 
-    # Check database
-    try:
-        await db.execute(text("SELECT 1"))
-        health_status.checks["database"] = "ok"
-        logger.debug("Database health check passed")
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        health_status.checks["database"] = "error"
-        health_status.status = "degraded"
-
-    # Check Redis
-    try:
-        REDIS_CLIENT.ping()
-        health_status.checks["redis"] = "ok"
-        logger.debug("Redis health check passed")
-    except Exception as e:
-        logger.error(f"Redis health check failed: {e}")
-        health_status.checks["redis"] = "error"
-        health_status.status = "degraded"
+    for name, error in (await _check_dependencies(db)).items():
+        if error is None:
+            health_status.checks[name] = "ok"
+            logger.debug(f"{name.capitalize()} health check passed")
+        else:
+            logger.error(f"{name.capitalize()} health check failed: {error}")
+            health_status.checks[name] = "error"
+            health_status.status = "degraded"
 
     return health_status
 
@@ -65,18 +94,19 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
     """
     Readiness probe for Kubernetes/orchestration.
     Returns 200 only if all critical dependencies are available.
+    A successful result is reused for _ReadyCache.TTL seconds, so frequent
+    probes do not hit the database and Redis every time.
     """
-    try:
-        # Check database
-        await db.execute(text("SELECT 1"))
+    if _READY_CACHE.is_fresh():
+        return {"status": "ready"}
 
-        # Check Redis
-        REDIS_CLIENT.ping()
+    errors = [error for error in (await _check_dependencies(db)).values() if error is not None]
+    if errors:
+        logger.error(f"Readiness check failed: {errors[0]}")
+        return {"status": "not ready", "error": str(errors[0])}
 
-        return {"status": "ready"}
-    except Exception as e:
-        logger.error(f"Readiness check failed: {e}")
-        return {"status": "not ready", "error": str(e)}
+    _READY_CACHE.mark_ok()
+    return {"status": "ready"}
 
 
 @health_router.get("/health/live", status_code=status.HTTP_200_OK)
@@ -1,9 +1,9 @@
-import json
+from functools import lru_cache
 
 from fastapi import Query, HTTPException
-from fastapi.encoders import jsonable_encoder
-from typing import Optional, List, Type, Any, Tuple, TypeVar
+from typing import Optional, List, Type, Any, Tuple, TypeVar, ClassVar
 from pydantic import BaseModel, Field, create_model, field_validator, ValidationError
+from pydantic_core import from_json
 
 from app.constants import ORDER_ASC, ORDER_DESC
 
@@ -13,6 +13,8 @@ from .types import NonNegativeOptionalInt
 F = TypeVar("F", bound=BaseModel)
 S = TypeVar("S", bound=BaseModel)
 
+SORT_ORDERS = frozenset((ORDER_ASC, ORDER_DESC, None))
+
 class CollectionQueryParams:
     """
     General class for collection query parameters.
@@ -31,7 +33,7 @@ class CollectionQueryParams:
     and parses everything as plain string. But react admin works with ?filter={}.
     
     methods:
-        - data: Returns the data as a dictionary.
+        - dict_data: filter, sort, page, perPage and range as a dictionary, built once.
     """
     filter_model: Optional[Type[F]] = None
     sort_model: Optional[Type[S]] = None
@@ -49,13 +51,8 @@ class CollectionQueryParams:
         self.filter = self._parse_filter(filter)
         self.sort = self._parse_sort(sort)
         self.range = self._parse_range(range)
-
-    @property
-    def dict_data(self) -> dict[str, Any]:
-        """
-        Return the self data as a dictionary.
-        """
-        return {
+        # Built once per request; services read it as the filter/sort/range payload
+        self.dict_data: dict[str, Any] = {
             "filter": self.filter,
             "sort": self.sort,
             "page": self.page,
@@ -70,53 +67,85 @@ class CollectionQueryParams:
         if not filter_raw or not self.filter_model:
             return None
         try:
-            data = json.loads(filter_raw)
-            return self.filter_model(**data).model_dump(exclude_unset=True)
-        except json.JSONDecodeError as e:
-            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+            # Parse and validate straight from the JSON string in pydantic-core
+            return self.filter_model.model_validate_json(filter_raw).model_dump(exclude_unset=True)
         except ValidationError as e:
-            # Convert the validation error to a format FastAPI understands
+            if e.errors()[0]["type"] == "json_invalid":
+                raise HTTPException(status_code=400, detail=f"Invalid JSON: {e.errors()[0]['msg']}")
+            # Without url and ctx the error dicts hold only JSON primitives
             raise HTTPException(
                 status_code=422,
-                detail=jsonable_encoder({"filter_model_validation_error": e.errors()})
+                detail={"filter_model_validation_error": e.errors(include_url=False, include_context=False)}
             )
             
-    def _parse_sort(self, sort_raw: Optional[str]) -> Optional[S]:
+    def _parse_sort(self, sort_raw: Optional[str]) -> Optional[List[Optional[str]]]:
         """
         parse passed sort string
+        Well-formed sorts are checked directly against the sort model's allowed
+        fields; the model itself is only built to report an unknown order.
         """
         if not sort_raw or not self.sort_model:
             return None
         try:
-            loaded_sort = json.loads(sort_raw)
-            validate = self.sort_model(sort=loaded_sort[0], order=loaded_sort[1])
-            return loaded_sort
-        except json.JSONDecodeError as e:
+            loaded_sort = from_json(sort_raw)
+        except ValueError as e:
             raise HTTPException(
                 status_code=422,  
-                detail=jsonable_encoder({"sort_model_validation_error": f"Invalid JSON: {str(e)}"})
+                detail={"sort_model_validation_error": f"Invalid JSON: {str(e)}"}
             )
-        except ValidationError as e:
+        if not isinstance(loaded_sort, list) or len(loaded_sort) != 2:
             raise HTTPException(
                 status_code=422,  
-                detail=jsonable_encoder({"sort_model_validation_error": e.errors()})
+                detail={"sort_model_validation_error": "sort must be a list [field_name, ASC/DESC]"}
             )
+        sort_field, sort_order = loaded_sort
+        if not isinstance(sort_order, (str, type(None))) or sort_order not in SORT_ORDERS:
+            try:
+                self.sort_model(sort=sort_field, order=sort_order)
+            except ValidationError as e:
+                raise HTTPException(
+                    status_code=422,  
+                    detail={"sort_model_validation_error": e.errors(include_url=False, include_context=False)}
+                )
+        if not isinstance(sort_field, str) or sort_field not in self.sort_model.allowed_fields:
+            # The sort model's validator drops fields that are not sortable
+            return None
+        return loaded_sort
         
-    def _parse_range(self, range_raw: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    def _parse_range(self, range_raw: Optional[str]) -> Optional[Tuple[Optional[int], Optional[int]]]:
         """
         parse passed range string
+        Plain non-negative int (or null) bounds are taken as is; anything else
+        goes through RangeQueryParams for coercion and its error messages.
         """
         if not range_raw:
             return None
         try:
-            start, end = json.loads(range_raw)
+            loaded_range = from_json(range_raw)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=422,  
+                detail={"range_model_validation_error": f"Invalid range: {str(e)}"}
+            )
+        if not isinstance(loaded_range, list) or len(loaded_range) != 2:
+            raise HTTPException(
+                status_code=422,  
+                detail={"range_model_validation_error": "Invalid range: range must be a list [start, end]"}
+            )
+        start, end = loaded_range
+        if all(
+            value is None or (type(value) is int and value >= 0)
+            for value in (start, end)
+        ):
+            return (start, end)
+        try:
             validated = RangeQueryParams(start=start, end=end)
-            return (validated.start, validated.end)
-        except (ValueError, TypeError) as e:
+        except ValidationError as e:
             raise HTTPException(
                 status_code=422,  
-                detail=jsonable_encoder({"range_model_validation_error": e.errors()})
+                detail={"range_model_validation_error": e.errors(include_url=False, include_context=False)}
             )
+        return (validated.start, validated.end)
 
 
 class RangeQueryParams(BaseModel):
@@ -134,7 +163,13 @@ def create_filter_model(filter_fields: List[Any], name="FilterModel") -> Type[Ba
     filter_fields: tuple or string
         - If tuple, the first element is the field name and the second is the type.
         - If string, the field name is the string and the type is Optional[str].
+    Models are cached, so identical field lists share one class per process.
     """
+    return _build_filter_model(tuple(filter_fields), name)
+
+
+@lru_cache(maxsize=None)
+def _build_filter_model(filter_fields: Tuple[Any, ...], name: str) -> Type[BaseModel]:
     fields = {}
     for filter_var in filter_fields:
         if isinstance(filter_var, tuple):
@@ -152,8 +187,16 @@ def create_sort_model(sort_fields: List[str], name="SortModel") -> Type[BaseMode
     """
     Dynamically create a Pydantic model with validation for sort field.
     sort_fields: list of allowed field names to be sorted by.
+    Models are cached, so identical field lists share one class per process.
     """
+    return _build_sort_model(tuple(sort_fields), name)
+
+
+@lru_cache(maxsize=None)
+def _build_sort_model(sort_fields: Tuple[str, ...], name: str) -> Type[BaseModel]:
     class SortModel(BaseModel):
+        allowed_fields: ClassVar[frozenset] = frozenset(sort_fields)
+
         sort: Optional[str] = Field(None)
         order: Optional[str] = Field(None)
         
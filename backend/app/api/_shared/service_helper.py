@@ -3,7 +3,7 @@
 import logging
 from typing import Dict, Type, Any
 from app.database.exceptions import ForeignKeyError
-from app.utils.queries.fetching import is_record_exists
+from sqlalchemy import String, exists, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -17,6 +17,10 @@ async def validate_foreign_keys(
     """
     Validate all foreign key references exist.
 
+    All references are checked in a single UNION ALL query that returns the
+    names of the fields whose referenced row exists. A row referenced by
+    several fields is checked once.
+
     Args:
         db: Database session
         data: Dictionary of data to validate
@@ -25,7 +29,23 @@ async def validate_foreign_keys(
     Raises:
         ForeignKeyError: If a foreign key reference doesn't exist
     """
+    # eta_* and etd_* fields often reference the same driver/truck/trailer,
+    # so each referenced row is checked once, under the first field naming it
+    fields_by_reference: Dict[tuple, list] = {}
     for field, model in fk_validation_map.items():
         if fk_id := data.get(field):
-            if not await is_record_exists(db, model, fk_id):
-                raise ForeignKeyError(field, model.__name__)
+            fields_by_reference.setdefault((model, fk_id), []).append(field)
+    if not fields_by_reference:
+        return
+
+    subqueries = [
+        select(literal(fields[0], String).label("field")).where(exists().where(model.id == fk_id))
+        for (model, fk_id), fields in fields_by_reference.items()
+    ]
+    query = subqueries[0] if len(subqueries) == 1 else union_all(*subqueries)
+    result = await db.execute(query)
+    existing_fields = set(result.scalars().all())
+
+    for (model, _), fields in fields_by_reference.items():
+        if fields[0] not in existing_fields:
+            raise ForeignKeyError(fields[0], model.__name__)
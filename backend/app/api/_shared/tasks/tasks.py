@@ -7,7 +7,9 @@
 # from app.utils.dates.dates_conversion import get_utc_datetime_by_terminal
 
 
-# @celery_app.task(base=TaskBase, bind=True, name="add_order_document_text")
+# Re-parsing a document rewrites the same text row, so the task is safe to rerun
+# and is only acked once it finished
+# @celery_app.task(base=TaskBase, bind=True, name="add_order_document_text", acks_late=True)
 # def add_order_document_text(self, document_id: uuid.UUID, skip_not_empty=False):
 # 	"""
 # 	Parses the document with the given ID and adds its text to the OrderDocumentText table
@@ -40,10 +40,8 @@ class DriversResource:
         Get all drivers with optional filtering, sorting, and pagination.
         """
         drivers, count = await self.driver_service.get_all(query_params)
-        if query_params.dict_data.get("range"):
-            self.response.headers["Content-Range"] = generate_range(
-                query_params.dict_data.get("range"), count
-            )
+        if range_ := query_params.range:
+            self.response.headers["Content-Range"] = generate_range(range_, count)
         return drivers
 
     @drivers_router.get("/drivers/{driver_id}", response_model=ResponseDriverSchema)
@@ -1,11 +1,9 @@
 import uuid
-from fastapi import Depends, Response, status, Form, UploadFile, File
+from fastapi import BackgroundTasks, Depends, Response, status, Form, UploadFile, File
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 
-from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models.orders.enums import OrderDocumentType
-from app.database.conn import get_db
 from app.utils.queries.queries import generate_range
 
 from .schemas import (
@@ -13,12 +11,28 @@ from .schemas import (
 	CollectionOrderDocumentsQueryParams,
 	UpdateOrderDocumentSchema,
 )
-from .service import OrderDocumentsService
+from .service import OrderDocumentsService, get_order_documents_service
 
 
 order_documents_router = InferringRouter(prefix="/orders", tags=["order_documents"])
 
 
+# Valid document types by their form value
+_DOC_TYPE_BY_VALUE: dict[str, OrderDocumentType] = {doc_type.value: doc_type for doc_type in OrderDocumentType}
+
+
+def _resolve_doc_type(
+	types: list[str] | None, index: int, default: OrderDocumentType
+) -> OrderDocumentType:
+	"""
+	Pick the type of the index-th batch file: its own entry in types if present
+	and valid, otherwise the batch default.
+	"""
+	if types and index < len(types):
+		return _DOC_TYPE_BY_VALUE.get(types[index], default)
+	return default
+
+
 @cbv(order_documents_router)
 class OrderDocumentsCRUD:
 	"""
@@ -27,12 +41,15 @@ class OrderDocumentsCRUD:
 	File serving operations (download, view) are in file_operations.py.
 	"""
 
-	def __init__(self, response: Response, db: AsyncSession = Depends(get_db)):
+	def __init__(
+		self,
+		response: Response,
+		order_documents_service: OrderDocumentsService = Depends(get_order_documents_service),
+	):
 		"""
-		Initialize with database session, service, and response object.
+		Initialize with the request's service and response object.
 		"""
-		self.db = db
-		self.order_documents_service = OrderDocumentsService(self.db)
+		self.order_documents_service = order_documents_service
 		self.response = response
 
 	@order_documents_router.get("/{order_id}/documents/", response_model=list[ResponseOrderDocumentSchema])
@@ -48,10 +65,8 @@ class OrderDocumentsCRUD:
 			order_id,
 			query_params,
 		)
-		if query_params.dict_data.get("range"):
-			self.response.headers["Content-Range"] = generate_range(
-				query_params.dict_data.get("range"), count
-			)
+		if range_ := query_params.range:
+			self.response.headers["Content-Range"] = generate_range(range_, count)
 		return documents
 
 	@order_documents_router.get("/{order_id}/documents/{document_id}", response_model=ResponseOrderDocumentSchema)
@@ -97,23 +112,15 @@ class OrderDocumentsCRUD:
 		"""
 		Create multiple order documents at once (batch upload).
 		"""
-		created_documents = []
-		for index, file in enumerate(files):
-			# Use individual type if provided, otherwise use default type
-			doc_type = type
-			if types and index < len(types):
-				try:
-					doc_type = OrderDocumentType(types[index])
-				except ValueError:
-					doc_type = type
-
-			document = await self.order_documents_service.create_order_document(
-				order_id=order_id,
-				file=file,
-				title=file.filename or "Untitled",
-				doc_type=doc_type,
-			)
-			created_documents.append(document)
+		documents = [
+			(file, file.filename or "Untitled", _resolve_doc_type(types, index, type))
+			for index, file in enumerate(files)
+		]
+
+		created_documents = await self.order_documents_service.create_order_documents(
+			order_id=order_id,
+			documents=documents,
+		)
 
 		return {
 			"created": len(created_documents),
@@ -134,20 +141,26 @@ class OrderDocumentsCRUD:
 	@order_documents_router.put("/{order_id}/documents/{document_id}", response_model=ResponseOrderDocumentSchema)
 	async def update_order_document(self, order_id: uuid.UUID, document_id: uuid.UUID, body: UpdateOrderDocumentSchema):
 		"""
-		Update an existing order document (full update).
+		Update an existing order document.
+		Only fields sent in the body are written, as for orders; omitted fields are left untouched.
 		"""
 		updated_document = await self.order_documents_service.update_order_document(
 			order_document_id=document_id,
-			data=body.model_dump(),
+			data=body.model_dump(exclude_unset=True),
 		)
 		return updated_document
 
 	@order_documents_router.delete("/{order_id}/documents/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
-	async def delete_order_document(self, order_id: uuid.UUID, document_id: uuid.UUID):
+	async def delete_order_document(
+		self, order_id: uuid.UUID, document_id: uuid.UUID, background_tasks: BackgroundTasks
+	):
 		"""
 		Delete an existing order document.
+		The stored file is removed after the response, once the delete is committed.
 		"""
-		await self.order_documents_service.delete_order_document(order_document_id=document_id)
+		await self.order_documents_service.delete_order_document(
+			order_document_id=document_id, background_tasks=background_tasks
+		)
 		return None
 
 
@@ -1,14 +1,18 @@
 import os
+import stat
+import hashlib
+import asyncio
 import uuid
-from fastapi import Depends, Response, HTTPException
+from urllib.parse import quote
+from fastapi import Depends, Request, Response, HTTPException
+from fastapi.responses import FileResponse
 from fastapi_utils.cbv import cbv
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.files import get_mime_type, is_displayable_in_browser, encode_filename_for_header
-from app.database.conn import get_db
+from app.core.settings import settings
 
 from .api import order_documents_router
-from .service import OrderDocumentsService
+from .service import OrderDocumentsService, get_order_documents_service
 
 
 @cbv(order_documents_router)
@@ -19,12 +23,21 @@ class OrderDocumentFileServing:
 	CRUD operations (including file uploads) are in api.py.
 	"""
 
-	def __init__(self, response: Response, db: AsyncSession = Depends(get_db)):
+	# Stored files never change in place, so clients may reuse them briefly
+	# and revalidate with If-None-Match afterwards
+	CACHE_CONTROL = "private, max-age=60"
+
+	def __init__(
+		self,
+		request: Request,
+		response: Response,
+		order_documents_service: OrderDocumentsService = Depends(get_order_documents_service),
+	):
 		"""
-		Initialize with database session and service.
+		Initialize with the request's service.
 		"""
-		self.db = db
-		self.order_documents_service = OrderDocumentsService(self.db)
+		self.order_documents_service = order_documents_service
+		self.request = request
 		self.response = response
 
 	@order_documents_router.get("/{order_id}/documents/{document_id}/download")
@@ -34,34 +47,123 @@ class OrderDocumentFileServing:
 		Forces download with proper filename for all file types.
 		"""
 		# Get document from service
-		document = await self.order_documents_service.get_order_document_by_id(document_id)
+		document = await self.order_documents_service.get_order_document_file(document_id)
 
 		file_path = document.src
-		if not file_path or not os.path.exists(file_path):
-			raise HTTPException(status_code=404, detail="File not found")
+		stat_result = await self._stat_document_file(file_path)
 
 		# Get filename from document title or file path
 		# Ensure the filename has the correct extension from the actual file
 		filename = self._ensure_filename_extension(document.title, file_path)
 
-		# Get MIME type
-		mime_type = get_mime_type(file_path)
-
-		# Read file content
-		with open(file_path, 'rb') as f:
-			content = f.read()
+		# Get MIME type (stored on upload; detected for older documents)
+		mime_type = document.mime_type or get_mime_type(file_path)
 
 		# Encode filename for Content-Disposition header
 		content_disposition = encode_filename_for_header(filename)
 
-		return Response(
-			content=content,
-			media_type=mime_type,
+		return self._file_response(
+			file_path,
+			stat_result,
+			mime_type,
 			headers={
 				"Content-Disposition": content_disposition
 			}
 		)
 
+	def _file_response(
+		self,
+		file_path: str,
+		stat_result: os.stat_result,
+		mime_type: str,
+		headers: dict[str, str] | None = None,
+	) -> Response:
+		"""
+		Build the file response, or a 304 if the client already has this version.
+		FileResponse streams the file in chunks off the event loop. With
+		USE_XACCEL, nginx sends the file instead.
+		"""
+		etag = self._etag(stat_result, mime_type, headers)
+		if_none_match = self.request.headers.get("if-none-match")
+		if if_none_match and self._etag_matches(etag, if_none_match):
+			return Response(
+				status_code=304,
+				headers={"ETag": etag, "Cache-Control": self.CACHE_CONTROL},
+			)
+
+		if settings.USE_XACCEL:
+			accel_uri = self._xaccel_uri(file_path)
+			if accel_uri is not None:
+				# nginx sends the file (with Range support); no file I/O here
+				return Response(
+					media_type=mime_type,
+					headers={
+						**(headers or {}),
+						"X-Accel-Redirect": accel_uri,
+						"ETag": etag,
+						"Cache-Control": self.CACHE_CONTROL,
+					},
+				)
+
+		response = FileResponse(
+			path=file_path,
+			stat_result=stat_result,
+			media_type=mime_type,
+			headers=headers,
+		)
+		response.headers["ETag"] = etag
+		response.headers["Cache-Control"] = self.CACHE_CONTROL
+		return response
+
+	@staticmethod
+	def _xaccel_uri(file_path: str) -> str | None:
+		"""
+		Map a stored file path to its URI under the internal nginx location.
+		Returns None for files outside FILES_PATH, which are served directly.
+		"""
+		relative_path = os.path.relpath(file_path, settings.FILES_PATH)
+		if relative_path.startswith(os.pardir):
+			return None
+		return settings.XACCEL_LOCATION + quote(relative_path)
+
+	@staticmethod
+	def _etag(stat_result: os.stat_result, mime_type: str, headers: dict[str, str] | None) -> str:
+		"""
+		ETag of the file as served: its mtime and size, plus the Content-Type and
+		Content-Disposition, so a changed title or mime_type is not answered with 304.
+		"""
+		content_disposition = (headers or {}).get("Content-Disposition", "")
+		version = f"{stat_result.st_mtime}-{stat_result.st_size}-{mime_type}-{content_disposition}"
+		return f'"{hashlib.md5(version.encode(), usedforsecurity=False).hexdigest()}"'
+
+	@staticmethod
+	def _etag_matches(etag: str, if_none_match: str) -> bool:
+		"""
+		Weak comparison of an ETag against an If-None-Match header value.
+		"""
+		if if_none_match.strip() == "*":
+			return True
+		return any(
+			candidate.strip().removeprefix("W/") == etag
+			for candidate in if_none_match.split(",")
+		)
+
+	async def _stat_document_file(self, file_path: str | None) -> os.stat_result:
+		"""
+		Stat the document file in one syscall, raising 404 if it is missing.
+		Runs in a worker thread so slow filesystems do not stall the event loop.
+		The result is passed on to the response so it does not stat again.
+		"""
+		if not file_path:
+			raise HTTPException(status_code=404, detail="File not found")
+		try:
+			stat_result = await asyncio.to_thread(os.stat, file_path)
+		except (FileNotFoundError, NotADirectoryError):
+			raise HTTPException(status_code=404, detail="File not found")
+		if not stat.S_ISREG(stat_result.st_mode):
+			raise HTTPException(status_code=404, detail="File not found")
+		return stat_result
+
 	def _ensure_filename_extension(self, title: str | None, file_path: str) -> str:
 		"""
 		Ensure the filename has the correct extension from the actual file.
@@ -93,34 +195,28 @@ class OrderDocumentFileServing:
 		Files that cannot be displayed (Office docs) are downloaded.
 		"""
 		# Get document from service
-		document = await self.order_documents_service.get_order_document_by_id(document_id)
+		document = await self.order_documents_service.get_order_document_file(document_id)
 
 		file_path = document.src
-		if not file_path or not os.path.exists(file_path):
-			raise HTTPException(status_code=404, detail="File not found")
+		stat_result = await self._stat_document_file(file_path)
 
-		# Read file content
-		with open(file_path, 'rb') as f:
-			content = f.read()
-
-		# Get MIME type
-		mime_type = get_mime_type(file_path)
+		# Get MIME type (stored on upload; detected for older documents)
+		mime_type = document.mime_type or get_mime_type(file_path)
 
 		# Check if browser can display this file type
 		if is_displayable_in_browser(mime_type):
 			# Display inline (PDF, images, videos, text, etc.)
-			return Response(
-				content=content,
-				media_type=mime_type
-			)
+			# No filename, so the response does not set an attachment disposition
+			return self._file_response(file_path, stat_result, mime_type)
 		else:
 			# Force download for non-displayable types (Office docs, etc.)
 			# Ensure the filename has the correct extension from the actual file
 			filename = self._ensure_filename_extension(document.title, file_path)
 			content_disposition = encode_filename_for_header(filename)
-			return Response(
-				content=content,
-				media_type=mime_type,
+			return self._file_response(
+				file_path,
+				stat_result,
+				mime_type,
 				headers={
 					"Content-Disposition": content_disposition
 				}
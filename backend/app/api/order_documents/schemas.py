@@ -63,6 +63,7 @@ class ResponseOrderDocumentSchema(ResponseBaseModel):
 	title: str | None
 	order_id: uuid.UUID
 	thumbnail: str | None
+	mime_type: str | None = None
 	created_at: datetime | None
 
 	@computed_field
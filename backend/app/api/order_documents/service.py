@@ -1,34 +1,63 @@
 import os
+import errno
 import uuid
 import shutil
+import asyncio
+from datetime import date
 
-from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import select, func
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, Depends, HTTPException, UploadFile, status
+from sqlalchemy import bindparam, delete, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.queries.fetching import (
-    fetch_one_or_none,
-    fetch_all,
+    fetch_mappings_with_count,
     fetch_count_query,
-    fetch_one_or_404,
+    fetch_row_or_404,
+    get_one_or_404,
     is_record_exists,
 )
 from app.utils.queries.queries import apply_filter_sort_range_for_query
 from app.utils.models.update_model import update_model_fields
-from app.utils.files import validate_file_upload
+from app.utils.files import validate_file_upload, get_mime_type
 
 from app.api._shared.base_service import BaseService
 # from app.api._shared.tasks.tasks import add_order_document_text
+from app.database.conn import get_db
 from app.database.exceptions import ForeignKeyError, NotFoundError
 
 from app.database.models.orders.enums import OrderDocumentType
-from app.database.models.orders import OrderDocument, OrderDocumentText, Order
+from app.database.models.orders import OrderDocument, Order
 
 from app.core.settings import settings
 
 from .schemas import CollectionOrderDocumentsQueryParams
 
 
+# Uploads are written under this suffix and renamed once their row exists
+PART_FILE_SUFFIX = ".part"
+
+# posix_fallocate errors meaning the filesystem cannot preallocate
+FALLOCATE_UNSUPPORTED_ERRNOS = frozenset((errno.EOPNOTSUPP, errno.EINVAL, errno.ENOSYS))
+
+# Smallest copyfileobj buffer, the shutil default on Linux
+MIN_COPY_CHUNK_SIZE = 64 * 1024
+
+# copy_file_range errors meaning "not possible here" rather than an I/O failure
+COPY_FILE_RANGE_UNSUPPORTED_ERRNOS = frozenset(
+    (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF)
+)
+
+# File lookup built once; the id is bound per call as the "id" parameter
+ORDER_DOCUMENT_FILE_BY_ID = select(
+    OrderDocument.src, OrderDocument.title, OrderDocument.mime_type
+).where(OrderDocument.id == bindparam("id"))
+
+# (src, title, mime_type) rows for download/view, kept per worker process for a short time.
+# Entries are dropped on update/delete; other workers see changes after the TTL.
+_order_document_file_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+
 class OrderDocumentsService(BaseService):
     """
     Service class for handling order document-related operations.
@@ -39,23 +68,39 @@ class OrderDocumentsService(BaseService):
         "order_id": Order,
     }
 
+    # Max number of batch upload files written to disk at the same time
+    BATCH_SAVE_CONCURRENCY = 8
+
+    # Chunk size for copying uploads to disk; 1 MiB keeps syscalls per file low
+    COPY_CHUNK_SIZE = 1024 * 1024
+
     async def get_all_order_documents(
         self, order_id: uuid.UUID, querystring: CollectionOrderDocumentsQueryParams
-    ) -> tuple[list[OrderDocument], int]:
+    ) -> tuple[list, int]:
         """
         Fetch all order_documents with optional filtering, sorting, and pagination.
+        Rows are returned as column mappings, not OrderDocument instances.
         """
-        select_query = select(OrderDocument).where(OrderDocument.order_id == order_id)
+        # The total comes back with the page as a count() OVER () column
+        select_query = select(
+            *OrderDocument.__table__.columns, func.count().over().label("total_count")
+        ).where(
+            OrderDocument.order_id == order_id
+        )
         count_query = select(func.count()).select_from(OrderDocument).where(OrderDocument.order_id == order_id)
         query, count_query = apply_filter_sort_range_for_query(
             OrderDocument,
             select_query,
             count_query,
             querystring.dict_data,
+            # Documents uploaded before created_at had a default have NULL there: list them last
+            fallback_sort=[OrderDocument.created_at.desc().nulls_last()],
         )
 
-        order_documents = await fetch_all(self.db, query)
-        order_documents_count = await fetch_count_query(self.db, count_query)
+        order_documents, order_documents_count = await fetch_mappings_with_count(self.db, query)
+        # An empty page past the end has no window column to read the total from
+        if not order_documents and querystring.range and querystring.range[0]:
+            order_documents_count = await fetch_count_query(self.db, count_query)
         return order_documents, order_documents_count
 
 
@@ -65,11 +110,28 @@ class OrderDocumentsService(BaseService):
         """
         Retrieve a single order_document by its ID.
         """
-        select_query = select(OrderDocument).where(OrderDocument.id == order_document_id)
-        order_document = await fetch_one_or_404(self.db, select_query, detail="Order document not found")
+        order_document = await get_one_or_404(
+            self.db, OrderDocument, order_document_id, detail="Order document not found"
+        )
         return order_document
 
 
+    async def get_order_document_file(self, order_document_id: uuid.UUID):
+        """
+        Retrieve the (src, title, mime_type) of an order_document for serving its file.
+        Results are cached briefly since clients often view then download.
+        """
+        cached = _order_document_file_cache.get(order_document_id)
+        if cached is not None:
+            return cached
+
+        order_document_file = await fetch_row_or_404(
+            self.db, ORDER_DOCUMENT_FILE_BY_ID, detail="Order document not found", params={"id": order_document_id}
+        )
+        _order_document_file_cache[order_document_id] = order_document_file
+        return order_document_file
+
+
     async def create_order_document(
         self,
         order_id: uuid.UUID,
@@ -79,6 +141,8 @@ class OrderDocumentsService(BaseService):
     ):
         """
         Create a new order_document.
+        The row is committed here, after its file is moved into place, so the
+        response never names a file that does not exist yet.
         """
         # Validate order exists (path parameter, so 404 is appropriate)
         if not await is_record_exists(self.db, Order, order_id):
@@ -89,29 +153,14 @@ class OrderDocumentsService(BaseService):
 
         destination_path = None
         try:
-            # Create order_documents subdirectory if it doesn't exist
-            order_documents_dir = os.path.join(settings.FILES_PATH, "order_documents")
-            os.makedirs(order_documents_dir, exist_ok=True)
-            
-            # Generate unique filename
-            filename = f"{uuid.uuid4()}_{file.filename}"
-            destination_path = os.path.join(order_documents_dir, filename)
-            
-            # Save file to disk first
-            with open(destination_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # Save file to disk first (as a .part file), streaming it off the event loop
+            destination_path = await asyncio.to_thread(self._save_file, file)
 
             # Create database record after file is saved
             # Title is stored WITHOUT extension in the database
-            new_order_document = OrderDocument(
-                order_id=order_id,
-                title=title,
-                type=doc_type,
-                src=destination_path
-            )
-            self.db.add(new_order_document)
-            await self.db.flush()  # Flush without committing (get_db handles commit)
-            await self.db.refresh(new_order_document)
+            new_order_document = await self._add_order_document(order_id, title, doc_type, destination_path)
+
+            await self._publish_and_commit([destination_path])
 
             # add_order_document_text.delay(document_id=new_order_document.id)
             return new_order_document
@@ -121,9 +170,222 @@ class OrderDocumentsService(BaseService):
             raise
         except Exception as e:
             # Clean up file if it was created
-            if destination_path and os.path.exists(destination_path):
-                os.remove(destination_path)
+            if destination_path:
+                await asyncio.to_thread(self._remove_saved_files, [destination_path])
+            raise
+
+
+    async def create_order_documents(
+        self,
+        order_id: uuid.UUID,
+        documents: list[tuple[UploadFile, str, OrderDocumentType]],
+    ) -> list[OrderDocument]:
+        """
+        Create several order_documents at once from (file, title, type) items.
+        Files are written to disk concurrently in worker threads, then all rows
+        are inserted with a single flush and committed once the files are in place.
+        """
+        if not await is_record_exists(self.db, Order, order_id):
+            raise NotFoundError("Order", str(order_id))
+
+        for file, _, _ in documents:
+            await validate_file_upload(file)
+
+        semaphore = asyncio.Semaphore(self.BATCH_SAVE_CONCURRENCY)
+
+        async def save(file: UploadFile) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(self._save_file, file)
+
+        results = await asyncio.gather(
+            *(save(file) for file, _, _ in documents), return_exceptions=True
+        )
+        destination_paths = [result for result in results if isinstance(result, str)]
+        try:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            # One flush for the whole batch: SQLAlchemy sends a single
+            # multi-row INSERT ... RETURNING for these rows
+            new_order_documents = [
+                OrderDocument(
+                    order_id=order_id,
+                    title=title,
+                    type=doc_type,
+                    src=destination_path,
+                    mime_type=get_mime_type(destination_path),
+                )
+                for destination_path, (_, title, doc_type) in zip(results, documents)
+            ]
+            self.db.add_all(new_order_documents)
+            await self.db.flush()
+
+            await self._publish_and_commit(destination_paths)
+            return new_order_documents
+
+        except Exception:
+            # Clean up every file saved by this batch
+            await asyncio.to_thread(self._remove_saved_files, destination_paths)
+            raise
+
+
+    def _save_file(self, file: UploadFile) -> str:
+        """
+        Write an uploaded file under FILES_PATH and return its final path.
+
+        The bytes go to "<path>.part"; _publish_and_commit renames it to the
+        final path once the database row is flushed, so interrupted writes only
+        leave .part files behind.
+        """
+        # One subdirectory per upload day keeps directory sizes bounded;
+        # src stores the full path, so older files in the flat directory stay reachable
+        order_documents_dir = os.path.join(
+            settings.FILES_PATH, "order_documents", date.today().isoformat()
+        )
+        os.makedirs(order_documents_dir, exist_ok=True)
+
+        # Generate unique filename
+        filename = f"{uuid.uuid4()}_{file.filename}"
+        destination_path = os.path.join(order_documents_dir, filename)
+
+        part_path = destination_path + PART_FILE_SUFFIX
+
+        try:
+            with open(part_path, "wb") as buffer:
+                preallocated = self._preallocate(buffer, file.size)
+                if getattr(file.file, "_rolled", False):
+                    # The upload was spooled to a real temp file: copy in the kernel
+                    self._kernel_copy(file.file, buffer)
+                else:
+                    # copyfileobj copies in fixed-size chunks, never the whole upload at once;
+                    # small uploads get a buffer sized to them instead of a full chunk
+                    length = min(self.COPY_CHUNK_SIZE, max(MIN_COPY_CHUNK_SIZE, file.size or self.COPY_CHUNK_SIZE))
+                    shutil.copyfileobj(file.file, buffer, length=length)
+                if preallocated:
+                    # Drop any reserved tail if fewer bytes arrived than announced
+                    buffer.truncate()
+        except BaseException:
+            self._remove_file(part_path)
             raise
+        return destination_path
+
+
+    async def _publish_and_commit(self, destination_paths: list[str]) -> None:
+        """
+        Move saved .part files to their final paths, then commit their rows.
+
+        Renaming first means a committed row always points at a complete file;
+        callers remove the files if the rename or the commit fails.
+        """
+        await asyncio.to_thread(self._publish_files, destination_paths)
+        # Committed here rather than by get_db so a failed commit is seen while
+        # the files can still be cleaned up; get_db's own commit is then a no-op
+        await self.db.commit()
+
+    @staticmethod
+    def _publish_files(destination_paths: list[str]) -> None:
+        """
+        Atomically move saved .part files to their final paths.
+        """
+        for destination_path in destination_paths:
+            os.replace(destination_path + PART_FILE_SUFFIX, destination_path)
+
+    @classmethod
+    def _remove_saved_files(cls, destination_paths: list[str]) -> None:
+        """
+        Remove saved files, whether or not they were published yet.
+        """
+        for destination_path in destination_paths:
+            cls._remove_file(destination_path + PART_FILE_SUFFIX)
+            cls._remove_file(destination_path)
+
+
+    @staticmethod
+    def _preallocate(destination, size: int | None) -> bool:
+        """
+        Reserve size bytes for a new file in one go, so the filesystem can lay it
+        out contiguously instead of extending it write by write.
+        Returns False when nothing was reserved (unknown size, or no support).
+        """
+        if not size or not hasattr(os, "posix_fallocate"):
+            return False
+        try:
+            os.posix_fallocate(destination.fileno(), 0, size)
+        except OSError as e:
+            # Out of space is a real failure; a filesystem without fallocate is not
+            if e.errno not in FALLOCATE_UNSUPPORTED_ERRNOS:
+                raise
+            return False
+        return True
+
+    @staticmethod
+    def _kernel_copy(source, destination) -> None:
+        """
+        Copy the rest of a disk-backed file object into another inside the kernel,
+        without passing the bytes through Python.
+
+        copy_file_range(2) is tried first since it can reflink or copy server-side
+        on filesystems that support it; sendfile(2) is used when the kernel or the
+        pair of filesystems does not allow it.
+        """
+        source.flush()  # The spooled file may still hold buffered writes
+        source_fd = source.fileno()
+        destination_fd = destination.fileno()
+        offset = source.tell()
+        end = os.fstat(source_fd).st_size
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                while offset < end:
+                    copied = os.copy_file_range(source_fd, destination_fd, end - offset, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+            except OSError as e:
+                if e.errno not in COPY_FILE_RANGE_UNSUPPORTED_ERRNOS:
+                    raise
+
+        # copy_file_range writes at the destination's file position, so sendfile
+        # resumes exactly where it stopped
+        while offset < end:
+            sent = os.sendfile(destination_fd, source_fd, offset, end - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        """
+        Remove a stored file, ignoring files that are already gone.
+        """
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+
+    async def _add_order_document(
+        self,
+        order_id: uuid.UUID,
+        title: str,
+        doc_type: OrderDocumentType,
+        destination_path: str,
+    ) -> OrderDocument:
+        """
+        Add the database record for an already saved file.
+        """
+        new_order_document = OrderDocument(
+            order_id=order_id,
+            title=title,
+            type=doc_type,
+            src=destination_path,
+            mime_type=get_mime_type(destination_path),
+        )
+        self.db.add(new_order_document)
+        await self.db.flush()  # Flush without committing (get_db handles commit)
+        await self.db.refresh(new_order_document)
+        return new_order_document
 
 
     async def update_order_document(
@@ -132,32 +394,43 @@ class OrderDocumentsService(BaseService):
         """
         Update an existing order document.
         """
-        order_document_select_query = select(OrderDocument).where(OrderDocument.id == order_document_id)
-        order_document = await fetch_one_or_404(self.db, order_document_select_query, detail="Order document not found")
+        order_document = await get_one_or_404(
+            self.db, OrderDocument, order_document_id, detail="Order document not found"
+        )
 
         order_document = await update_model_fields(self.db, order_document, data)
+        _order_document_file_cache.pop(order_document_id, None)
 
         await self.db.flush()  # Flush without committing (get_db handles commit)
         await self.db.refresh(order_document)
         return order_document
 
-    async def delete_order_document(self, order_document_id: uuid.UUID):
+    async def delete_order_document(
+        self, order_document_id: uuid.UUID, background_tasks: BackgroundTasks
+    ) -> None:
         """
         Delete an existing order_document.
+        Its text row, if the parsing task created one, goes with it via ON DELETE CASCADE.
         """
-        order_document_select_query = select(OrderDocument).where(OrderDocument.id == order_document_id)
-        order_document = await fetch_one_or_404(self.db, order_document_select_query, detail="Order document not found")
+        result = await self.db.execute(
+            delete(OrderDocument)
+            .where(OrderDocument.id == order_document_id)
+            .returning(OrderDocument.id, OrderDocument.src)
+        )
+        deleted = result.first()
+        if deleted is None:
+            raise HTTPException(status_code=404, detail="Order document not found")
+        _order_document_file_cache.pop(order_document_id, None)
 
-        # Delete associated text if it exists (optional - may not exist if parsing task hasn't run)
-        order_document_text_select_query = select(OrderDocumentText).where(OrderDocumentText.order_document_id == order_document.id)
-        order_document_text = await fetch_one_or_none(self.db, order_document_text_select_query)
-        if order_document_text:
-            await self.db.delete(order_document_text)
+        # Background tasks run after the response, i.e. after get_db has committed,
+        # so a rolled back delete never loses its file
+        if deleted.src:
+            background_tasks.add_task(self._remove_file, deleted.src)
 
-        # Remove file from filesystem
-        if order_document.src and os.path.exists(order_document.src):
-            os.remove(order_document.src)
 
-        # Delete from database
-        await self.db.delete(order_document)
-        await self.db.flush()  # Flush without committing (get_db handles commit)
+def get_order_documents_service(db: AsyncSession = Depends(get_db)) -> OrderDocumentsService:
+    """
+    Dependency providing the order documents service for the request's session.
+    FastAPI caches it per request, so all routes of a request share one instance.
+    """
+    return OrderDocumentsService(db)
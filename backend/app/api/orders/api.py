@@ -3,6 +3,7 @@ import uuid
 from fastapi import Depends, Response
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
+from pydantic import TypeAdapter
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,6 +21,9 @@ from .service import OrderService
 
 orders_router = InferringRouter(tags=["orders"])
 
+# Validates and serializes a whole orders page in pydantic-core in one call
+ORDERS_LIST_ADAPTER = TypeAdapter(list[ResponseOrderSchema])
+
 
 @cbv(orders_router)
 class OrdersResource:
@@ -46,11 +50,15 @@ class OrdersResource:
 		need to be called like that because it's not a pydantic model and needs to be initialized
 		"""
         orders, count = await self.order_service.get_all_orders(query_params)
-        if query_params.dict_data.get("range"):
-            self.response.headers["Content-Range"] = generate_range(
-                query_params.dict_data.get("range"), count
-            )
-        return orders
+        # Returning a Response skips FastAPI's own validate-then-jsonable pass;
+        # response_model above is still used for the OpenAPI schema
+        response = Response(
+            content=ORDERS_LIST_ADAPTER.dump_json(ORDERS_LIST_ADAPTER.validate_python(orders)),
+            media_type="application/json",
+        )
+        if range_ := query_params.range:
+            response.headers["Content-Range"] = generate_range(range_, count)
+        return response
 
     @orders_router.get("/orders/{order_id}", response_model=ResponseOrderSchema)
     async def get_order_by_id(self, order_id: uuid.UUID):
@@ -1,6 +1,7 @@
 import uuid
 import logging
-from sqlalchemy import select, func
+from fastapi import HTTPException
+from sqlalchemy import select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import Order
@@ -9,17 +10,17 @@ from app.database.models.drivers import Driver
 from app.database.models.vehicles import Truck, Trailer
 from app.database.models.terminals import Terminal
 from app.api._shared.base_service import BaseService
+from app.api._shared.service_helper import validate_foreign_keys
 from app.database.exceptions import ForeignKeyError
 
 from app.utils.queries.fetching import (
     fetch_one_or_none,
-    fetch_all,
     fetch_count_query,
-    fetch_one_or_404,
+    fetch_mappings_with_count,
+    fetch_row_or_404,
     is_record_exists,
 )
 from app.utils.queries.queries import apply_filter_sort_range_for_query
-from app.utils.models.update_model import update_model_fields
 from app.utils.dates.date_filters import apply_date_filter_to_query
 from app.api._shared.schema.enums import DateRangeFilterModel
 
@@ -27,6 +28,21 @@ from .schemas import CollectionOrderQueryParams, CreateOrderSchema, UpdateOrderS
 
 logger = logging.getLogger(__name__)
 
+# Number of documents of the outer Order row, computed in the same statement.
+# count(*) only needs order_id, so it is answered by an index-only scan of
+# ix_order_documents_order_created.
+DOCUMENTS_COUNT = (
+    select(func.count())
+    .where(OrderDocument.order_id == Order.id)
+    .correlate(Order)
+    .scalar_subquery()
+    .label("documents_count")
+)
+
+# Plain column projection for read-only list pages. Rows are serialized straight
+# into the response, so no Order instances (or their selectin relationships) are loaded.
+ORDER_COLUMNS = Order.__table__.columns
+
 
 class OrderService(BaseService):
     """
@@ -44,11 +60,26 @@ class OrderService(BaseService):
         "terminal_id": Terminal,
     }
 
+    # Selective equality filters first, text search on reference last
+    filter_priority = {
+        "id": 0,
+        "terminal_id": 10,
+        "service": 20,
+        "commodity": 20,
+        "priority": 30,
+        "in_terminal": 30,
+        "reference": 90,
+    }
+
     async def get_all_orders(self, querystring: CollectionOrderQueryParams):
         """
         Fetch all orders with optional filtering, sorting, and pagination.
         """
-        select_query = select(Order)
+        # documents_count comes back with each order row instead of a follow-up query,
+        # and the total with the page as a count() OVER () column
+        select_query = select(
+            *ORDER_COLUMNS, DOCUMENTS_COUNT, func.count().over().label("total_count")
+        )
         count_query = select(func.count()).select_from(Order)
 
         # Apply date range filter if provided
@@ -67,13 +98,13 @@ class OrderService(BaseService):
             select_query,
             count_query,
             querystring.dict_data,
+            filter_priority=self.filter_priority,
         )
 
-        orders = await fetch_all(self.db, query)
-        orders_count = await fetch_count_query(self.db, count_query)
-
-        # Add documents_count to each order
-        await self._add_documents_count(orders)
+        orders, orders_count = await fetch_mappings_with_count(self.db, query)
+        # An empty page past the end has no window column to read the total from
+        if not orders and querystring.range and querystring.range[0]:
+            orders_count = await fetch_count_query(self.db, count_query)
 
         return orders, orders_count
 
@@ -81,23 +112,20 @@ class OrderService(BaseService):
         """
         Retrieve a single order by its ID.
         """
-        query = select(Order).where(Order.id == order_id)
-        order = await fetch_one_or_404(self.db, query, detail="Order not found")
-
-        # Add documents_count
-        await self._add_documents_count([order])
-
-        return order
+        query = select(*ORDER_COLUMNS, DOCUMENTS_COUNT).where(Order.id == order_id)
+        row = await fetch_row_or_404(self.db, query, detail="Order not found")
+        return row._mapping
 
     async def create_order(self, data: CreateOrderSchema):
         """
         Create a new order.
         """
-        # Validate foreign keys first
+        # Dump once: the same dict is validated and used to build the order.
+        # Unset fields are left out so their column defaults apply.
         data_dict = data.model_dump(exclude_unset=True)
         await self._validate_foreign_keys(data_dict)
 
-        order = Order(**data.model_dump())
+        order = Order(**data_dict)
         self.db.add(order)
         await self.db.flush()  # Get ID without committing (get_db handles commit)
         await self.db.refresh(order)
@@ -105,84 +133,54 @@ class OrderService(BaseService):
 
     async def _validate_foreign_keys(self, data: dict):
         """Validate all foreign key references exist."""
-        for field, model in self.FOREIGN_KEY_VALIDATION_MAP.items():
-            if fk_id := data.get(field):
-                if not await is_record_exists(self.db, model, fk_id):
-                    raise ForeignKeyError(field, model.__name__)
+        await validate_foreign_keys(self.db, data, self.FOREIGN_KEY_VALIDATION_MAP)
 
-    async def patch_order(self, order_id: uuid.UUID, data: UpdateOrderSchema) -> Order:
+    async def patch_order(self, order_id: uuid.UUID, data: UpdateOrderSchema):
         """
         Partially update an existing order.
         """
-        # Fetch the existing order
-        query = select(Order).where(Order.id == order_id)
-        order = await fetch_one_or_404(self.db, query, detail="Order not found")
-
         # Get only the fields that were explicitly set in the request
         updated_data = data.model_dump(exclude_unset=True)
+        return await self._update_order(order_id, updated_data)
 
-        if not updated_data:
-            return order  # No changes to apply
-
-        # Validate foreign keys if any are being updated
-        await self._validate_foreign_keys(updated_data)
-
-        # Update the order with the new data
-        updated_order = await update_model_fields(self.db, order, updated_data)
-        await self.db.flush()  # Flush without committing (get_db handles commit)
-        await self.db.refresh(updated_order)
-
-        return updated_order
-
-    async def update_order(self, order_id: uuid.UUID, data: UpdateOrderSchema) -> Order:
+    async def update_order(self, order_id: uuid.UUID, data: UpdateOrderSchema):
         """
         Entirely update an existing order.
         Note: Since UpdateOrderSchema has all optional fields, we exclude None values
         to avoid overwriting required fields (reference, service, terminal_id).
         For a true full replacement, use exclude_unset=True like PATCH.
         """
-        query = select(Order).where(Order.id == order_id)
-        order = await fetch_one_or_404(self.db, query, detail="Order not found")
-
         # Exclude unset fields to avoid setting required fields to None
         # This makes PUT behave more like PATCH for backward compatibility
         update_data = data.model_dump(exclude_unset=True)
+        return await self._update_order(order_id, update_data)
 
-        if not update_data:
-            return order  # No changes to apply
-
-        # Validate foreign keys
-        await self._validate_foreign_keys(update_data)
-
-        updated_order = await update_model_fields(self.db, order, update_data)
-        await self.db.flush()  # Flush without committing (get_db handles commit)
-        await self.db.refresh(updated_order)
-        return updated_order
-
-    async def _add_documents_count(self, orders: list[Order]):
+    async def _update_order(self, order_id: uuid.UUID, values: dict):
         """
-        Add documents_count attribute to each order efficiently.
-        Uses a single query to fetch all document counts.
+        Apply values to an order with a single UPDATE ... RETURNING and return
+        the updated row, documents_count included, as a mapping.
         """
-        if not orders:
-            return
-
-        # Get all order IDs
-        order_ids = [order.id for order in orders]
-
-        # Fetch document counts for all orders in a single query
-        count_query = (
-            select(
-                OrderDocument.order_id,
-                func.count(OrderDocument.id).label('count')
-            )
-            .where(OrderDocument.order_id.in_(order_ids))
-            .group_by(OrderDocument.order_id)
+        if not values:
+            return await self.get_order_by_id(order_id)  # No changes to apply
+
+        try:
+            await self._validate_foreign_keys(values)
+        except ForeignKeyError:
+            # A missing order is reported before a bad reference, as when it was loaded first
+            if not await is_record_exists(self.db, Order, order_id):
+                raise HTTPException(status_code=404, detail="Order not found")
+            raise
+
+        # A bulk UPDATE skips the model's @validates hooks, so lowercase here as they would
+        values = {
+            key: value.lower() if key in Order.LOWERCASE_FIELDS and value else value
+            for key, value in values.items()
+        }
+        query = (
+            update(Order)
+            .where(Order.id == order_id)
+            .values(**values)
+            .returning(*ORDER_COLUMNS, DOCUMENTS_COUNT)
         )
-
-        result = await self.db.execute(count_query)
-        counts_dict = {row.order_id: row.count for row in result}
-
-        # Assign counts to orders
-        for order in orders:
-            order.documents_count = counts_dict.get(order.id, 0)
+        row = await fetch_row_or_404(self.db, query, detail="Order not found")
+        return row._mapping
@@ -42,10 +42,8 @@ class TerminalsResource:
         Get all terminals with optional filtering, sorting, and pagination.
         """
         terminals, count = await self.terminal_service.get_all(query_params)
-        if query_params.dict_data.get("range"):
-            self.response.headers["Content-Range"] = generate_range(
-                query_params.dict_data.get("range"), count
-            )
+        if range_ := query_params.range:
+            self.response.headers["Content-Range"] = generate_range(range_, count)
         return terminals
 
     @terminals_router.get(
@@ -12,5 +12,15 @@ class TerminalService(BaseCRUDService[Terminal, CollectionTerminalQueryParams]):
 
     model = Terminal
 
+    # Everything ResponseTerminalSchema reads; detail responses are read-only
+    get_by_id_columns = (
+        Terminal.id,
+        Terminal.name,
+        Terminal.time_zone,
+        Terminal.address,
+        Terminal.short_name,
+        Terminal.account_code,
+    )
+
     # All basic CRUD operations (get_all, get_by_id) are inherited from BaseCRUDService
     # Add terminal-specific business logic methods here if needed
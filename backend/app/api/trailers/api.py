@@ -40,10 +40,8 @@ class TrailersResource:
         Get all trailers with optional filtering, sorting, and pagination.
         """
         trailers, count = await self.trailer_service.get_all(query_params)
-        if query_params.dict_data.get("range"):
-            self.response.headers["Content-Range"] = generate_range(
-                query_params.dict_data.get("range"), count
-            )
+        if range_ := query_params.range:
+            self.response.headers["Content-Range"] = generate_range(range_, count)
         return trailers
 
     @trailers_router.get("/trailers/{trailer_id}", response_model=ResponseTrailerSchema)
@@ -40,10 +40,8 @@ class TrucksResource:
         Get all trucks with optional filtering, sorting, and pagination.
         """
         trucks, count = await self.truck_service.get_all(query_params)
-        if query_params.dict_data.get("range"):
-            self.response.headers["Content-Range"] = generate_range(
-                query_params.dict_data.get("range"), count
-            )
+        if range_ := query_params.range:
+            self.response.headers["Content-Range"] = generate_range(range_, count)
         return trucks
 
     @trucks_router.get("/trucks/{truck_id}", response_model=ResponseTruckSchema)
@@ -31,6 +31,10 @@ class Settings(BaseSettings):
     # JWT settings
 
     FILES_PATH: str = "files"
+    # Let nginx send document files: responses carry an X-Accel-Redirect to
+    # XACCEL_LOCATION, an internal nginx location aliased to FILES_PATH
+    USE_XACCEL: bool = False
+    XACCEL_LOCATION: str = "/_protected_files/"
 
     #.env file is being searched in the root directory
     model_config = SettingsConfigDict(
@@ -65,7 +65,10 @@ class Order(BASE_MODEL):
 
 	documents = relationship("OrderDocument", back_populates="order", cascade="all, delete-orphan")
 
-	@validates('eta_truck', 'eta_trailer', 'etd_truck', 'etd_trailer')
+	# Stored lowercased, see convert_to_lower
+	LOWERCASE_FIELDS = ('eta_truck', 'eta_trailer', 'etd_truck', 'etd_trailer')
+
+	@validates(*LOWERCASE_FIELDS)
 	def convert_to_lower(self, key, value):
 		return value.lower() if value else value
 
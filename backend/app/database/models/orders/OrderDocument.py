@@ -2,6 +2,7 @@ import uuid
 from sqlalchemy.sql.schema import Column, ForeignKey
 from sqlalchemy.types import Integer, String, DateTime, Enum, UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from .enums.OrderDocumentType import OrderDocumentType
 from ...base_model import BASE_MODEL
 
@@ -15,11 +16,12 @@ class OrderDocument(BASE_MODEL):
     title = Column(String())
     order_id = Column(UUID(), ForeignKey("orders.id"))
     thumbnail = Column(String())
-    created_at = Column(DateTime(timezone=False))
+    mime_type = Column(String(127))
+    created_at = Column(DateTime(timezone=False), server_default=func.now())
 
     # Relationships
     order = relationship("Order", back_populates="documents")
-    document_text = relationship("OrderDocumentText", back_populates="document", uselist=False, cascade="all, delete-orphan")
+    document_text = relationship("OrderDocumentText", back_populates="document", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"Order_Document({self.id}, {self.entity_id}, {self.title})"
\ No newline at end of file
@@ -15,7 +15,7 @@ class OrderDocumentText(BASE_MODEL):
     process_status = Column(Enum(ProcessStatus), nullable=False, default=ProcessStatus.none)
     text_created_at = Column(DateTime(timezone=False), nullable=True)
     order_created_at = Column(DateTime(timezone=False), nullable=False)
-    order_document_id = Column(UUID, ForeignKey("order_documents.id"), primary_key=True)
+    order_document_id = Column(UUID, ForeignKey("order_documents.id", ondelete="CASCADE"), primary_key=True)
 
     # Relationships
     document = relationship("OrderDocument", back_populates="document_text")
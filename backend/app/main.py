@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import (
     orders_router,
@@ -10,6 +11,7 @@ from app.api import (
 )
 from app.api._shared.health import health_router
 from app.modules.cache import populate_cache_on_startup
+from app.modules.redis import ASYNC_REDIS_CLIENT
 from app.core.logging_config import setup_logging
 
 # Initialize structured logging
@@ -33,6 +35,8 @@ A comprehensive API for managing logistics orders, documents, drivers, vehicles,
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
+    # Encode JSON responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -68,3 +72,8 @@ app.include_router(terminals_router, prefix="/api/v1", tags=["terminals"])
 @app.on_event("startup")
 async def on_startup():
     await populate_cache_on_startup()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await ASYNC_REDIS_CLIENT.aclose()
@@ -21,6 +21,12 @@ task_default_queue = _default_task_queue
 task_default_exchange = _default_task_queue
 task_default_routing_key = _default_task_queue
 
+# Document parsing tasks run long: each worker process reserves one task at a time.
+# Tasks are acked when they start; acks_late is opted into per task, only for tasks
+# that are safe to run twice (a late-acked task is redelivered if the broker
+# connection drops or its visibility timeout passes).
+worker_prefetch_multiplier = 1
+
 imports = {
     "app.api.order_documents.tasks",
     "app.api._shared.tasks.tasks",
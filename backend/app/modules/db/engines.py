@@ -13,6 +13,7 @@ ASYNC_DB_ENGINE = create_async_engine(
     pool_recycle=3600,  # Recycle connections after 1 hour to avoid stale connections
     pool_pre_ping=True,  # Verify connection is alive before using it
     pool_timeout=30,  # Wait 30 seconds for a connection from the pool
+    pool_use_lifo=True,  # Reuse the most recently returned connection so idle ones can time out server-side
 )
 
 # Sync engine for Celery workers (no pooling to avoid issues with forked processes)
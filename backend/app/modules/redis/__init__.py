@@ -1,4 +1,8 @@
 import redis
+import redis.asyncio
 
 
 REDIS_CLIENT = redis.StrictRedis(host='redis', port=6379, db=0)
+
+# Non-blocking client for request handlers; awaiting it never blocks the event loop
+ASYNC_REDIS_CLIENT = redis.asyncio.Redis(host='redis', port=6379, db=0, max_connections=50)
@@ -4,6 +4,7 @@ Utility functions for file handling and MIME type detection.
 import os
 import mimetypes
 import logging
+from functools import lru_cache
 from typing import Optional, Tuple
 from urllib.parse import quote
 from fastapi import UploadFile, HTTPException, status
@@ -41,10 +42,11 @@ async def validate_file_upload(file: UploadFile) -> bool:
             detail=f"Unsupported file type: {file_ext}. Allowed: {', '.join(sorted(FileConfig.allowed_upload_extensions))}"
         )
 
-    # Check file size
-    contents = await file.read()
-    file_size = len(contents)
-    await file.seek(0)  # Reset file pointer for later reading
+    # Check file size without reading the upload into memory
+    file_size = file.size
+    if file_size is None:
+        file_size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(0)  # Reset file pointer for later reading
 
     if file_size > FileConfig.max_upload_size_bytes:
         max_size_mb = FileConfig.max_upload_size_bytes / 1024 / 1024
@@ -79,17 +81,26 @@ def get_mime_type(file_path: str) -> str:
     Returns:
         MIME type string (e.g., 'application/pdf')
     """
+    ext = os.path.splitext(file_path)[1].lower()
+    return _get_mime_type_for_extension(ext)
+
+
+@lru_cache(maxsize=256)
+def _get_mime_type_for_extension(ext: str) -> str:
+    """
+    Resolve and cache the MIME type for a lowercased extension (e.g., '.pdf').
+    """
     # Try standard library first
-    mime_type, _ = mimetypes.guess_type(file_path)
+    mime_type, _ = mimetypes.guess_type(f"file{ext}")
     
     if mime_type:
         return mime_type
     
     # Fallback to FileConfig mappings
-    ext = os.path.splitext(file_path)[1].lower()
     return FileConfig.mimetypes_by_extensions.get(ext, 'application/octet-stream')
 
 
+@lru_cache(maxsize=256)
 def is_displayable_in_browser(mime_type: str) -> bool:
     """
     Check if a file type can be displayed inline in a browser using FileConfig settings.
@@ -116,10 +127,12 @@ def is_displayable_in_browser(mime_type: str) -> bool:
     return mime_type in FileConfig.displayable_mime_types
 
 
+@lru_cache(maxsize=8192)
 def encode_filename_for_header(filename: str) -> str:
     """
     Encode filename for Content-Disposition header using RFC 5987.
     Handles Unicode filenames properly.
+    Cached since the same document names are served repeatedly.
     
     Args:
         filename: Original filename
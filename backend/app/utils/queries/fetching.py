@@ -14,6 +14,22 @@ async def fetch_all(db: AsyncSession, query: Select) -> list:
 	result = await db.execute(query)
 	return result.scalars().all()
 
+async def fetch_all_with_count(db: AsyncSession, query: Select) -> tuple[list, int]:
+	"""Fetch entities selected together with a trailing ``count() OVER ()`` column."""
+	result = await db.execute(query)
+	rows = result.all()
+	if not rows:
+		return [], 0
+	return [row[0] for row in rows], rows[0][-1]
+
+async def fetch_mappings_with_count(db: AsyncSession, query: Select, count_key: str = "total_count") -> tuple[list, int]:
+	"""Fetch column rows as mappings together with a ``count() OVER ()`` column named ``count_key``."""
+	result = await db.execute(query)
+	rows = result.mappings().all()
+	if not rows:
+		return [], 0
+	return rows, rows[0][count_key]
+
 async def fetch_count_query(db: AsyncSession, query: Select) -> int:
 	result = await db.execute(query)
 	return result.scalar() or 0
@@ -24,6 +40,21 @@ async def fetch_one_or_404(db: AsyncSession, query: Select, detail: str = "Item
         raise HTTPException(status_code=404, detail=detail)
     return result
 
+async def get_one_or_404(db: AsyncSession, Model, record_id: Any, detail: str = "Item not found") -> Any:
+	"""Get an entity by primary key, from the identity map when already loaded, or raise 404."""
+	result = await db.get(Model, record_id)
+	if result is None:
+		raise HTTPException(status_code=404, detail=detail)
+	return result
+
+async def fetch_row_or_404(db: AsyncSession, query: Select, detail: str = "Item not found", params: dict | None = None) -> Any:
+	"""Fetch the first row of a column projection or raise 404."""
+	result = await db.execute(query, params)
+	row = result.first()
+	if row is None:
+		raise HTTPException(status_code=404, detail=detail)
+	return row
+
 async def is_record_exists(db: AsyncSession, Model, record_id: uuid.UUID) -> bool:
     """Check if a record exists by model and id."""
     query = select(exists().where(Model.id == record_id))
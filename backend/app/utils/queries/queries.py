@@ -161,16 +161,25 @@ def exclude_keys_from_filter(filters: Dict[str, Any], exclude_keys: List[str]) -
 	return {k: v for k, v in filters.items() if k not in exclude_keys}
 
 
-def get_filter_expression(Model: Table, filters: Dict[str, Any]) -> Optional[BinaryExpression]:
+def get_filter_expression(
+	Model: Table,
+	filters: Dict[str, Any],
+	filter_priority: Optional[Dict[str, int]] = None,
+) -> Optional[BinaryExpression]:
 	"""
 	Build a combined SQLAlchemy filter expression from filter dictionary.
 
 	Supports special keys to exclude, global search query, multi-column OR filters,
 	and various operators.
 
+	Field filters are emitted in ascending ``filter_priority`` order (unlisted
+	fields get 100), so selective predicates come first. Recipe: equality on
+	indexed PK/FK columns first, enums and booleans next, text LIKE last.
+
 	Args:
 		Model: SQLAlchemy Table or ORM model.
 		filters: Dictionary of filters.
+		filter_priority: Optional mapping of field name to priority.
 
 	Returns:
 		Combined SQLAlchemy filter expression or None if no filters.
@@ -180,6 +189,12 @@ def get_filter_expression(Model: Table, filters: Dict[str, Any]) -> Optional[Bin
 
 	global_filter_query = filters.pop("_query", None)
 
+	if filter_priority:
+		filters = dict(sorted(
+			filters.items(),
+			key=lambda item: filter_priority.get(safe_unpack_filter(item[0])[0], 100),
+		))
+
 	fields_filters: List[BinaryExpression] = []
 	fields_filters_by_query: List[BinaryExpression] = []
 
@@ -220,18 +235,21 @@ def get_filter_expression(Model: Table, filters: Dict[str, Any]) -> Optional[Bin
 		return or_(*fields_filters_by_query)
 
 
-def with_range(query: Select, range_: Tuple[int, int]) -> Select:
+def with_range(query: Select, range_: Tuple[Optional[int], Optional[int]]) -> Select:
 	"""
 	Apply pagination (offset, limit) to a SQLAlchemy query.
 
 	Args:
 		query: SQLAlchemy Select query.
-		range_: Tuple (start, end) indices.
+		range_: Tuple (start, end) indices; a None start is 0, a None end is unbounded.
 
 	Returns:
 		Query with offset and limit applied.
 	"""
 	range_from, range_to = range_
+	range_from = range_from or 0
+	if range_to is None:
+		return query.offset(range_from) if range_from else query
 	if range_to >= 0:
 		query = query.offset(range_from).limit(range_to - range_from + 1)
 	return query
@@ -245,6 +263,7 @@ def apply_filter_sort_range_for_query(
 	sort_by: Optional[List[Any]] = None,
 	fallback_sort: Optional[List[Any]] = None,
 	apply_range: bool = True,
+	filter_priority: Optional[Dict[str, int]] = None,
 ) -> Tuple[Select, Select]:
 	"""
 	Apply filters, sorting, and range pagination to queries.
@@ -257,6 +276,7 @@ def apply_filter_sort_range_for_query(
 		sort_by: Optional explicit sort expressions.
 		fallback_sort: Optional fallback sort expressions if no sort specified.
 		apply_range: Whether to apply range pagination.
+		filter_priority: Optional order in which filter fields are applied.
 
 	Returns:
 		Tuple of (query_with_filters, count_query_with_filters).
@@ -264,7 +284,7 @@ def apply_filter_sort_range_for_query(
 	data = data or {}
 
 	if "filter" in data and data["filter"]:
-		filter_expr = get_filter_expression(Model, data["filter"])
+		filter_expr = get_filter_expression(Model, data["filter"], filter_priority)
 		if filter_expr is not None:
 			query = query.where(filter_expr)
 			count_query = count_query.where(filter_expr)
@@ -279,9 +299,7 @@ def apply_filter_sort_range_for_query(
 		query = query.order_by(*fallback_sort)
 
 	if apply_range and "range" in data and data["range"]:
-		range_from, range_to = data["range"]
-		if range_to >= 0:
-			query = query.offset(range_from).limit(range_to - range_from + 1)
+		query = with_range(query, data["range"])
 
 
 	return query, count_query
@@ -300,4 +318,7 @@ def generate_range(_range: Optional[Tuple[int, int]], count: int) -> str:
 	"""
 	if not _range:
 		return f"0-{count}/{count}"
-	return f"{_range[0]}-{_range[1]}/{count}"
\ No newline at end of file
+	range_from, range_to = _range
+	if range_to is None:
+		range_to = max(count - 1, 0)
+	return f"{range_from or 0}-{range_to}/{count}"
\ No newline at end of file
@@ -28,7 +28,7 @@ teardown()
 
 # start 3 celery worker via `celery multi` with declared logfile for `tail -f`
 # celery -A config.celery_app multi start 3 -l INFO -Q:1 queue1 -Q:2 queue1 -Q:3 queue3,celery -c:1-2 1 \
-celery -A app.modules.celery multi start cpu -c:cpu 2 -Q:cpu cpu -l INFO \
+celery -A app.modules.celery multi start cpu -c:cpu "${CELERY_WORKER_CONCURRENCY:-2}" -Q:cpu cpu -l INFO \
     --pidfile=./celery-%n.pid \
     --logfile=./celery-%n%I.log \
 #    -P solo\ uncomment if you need the task logs.
@@ -1,6 +1,10 @@
 import pytest
 import uuid
 from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.api._shared.base_crud_service import _estimated_counts
+from app.api.drivers.service import DriverService
 
 from app.database.models.drivers import Driver
 
@@ -27,6 +31,144 @@ class TestDriversAPI:
         assert data[0]["name"] == sample_driver.name
         assert data[0]["phone"] == sample_driver.phone
 
+    @pytest.mark.asyncio
+    async def test_get_drivers_content_range(
+        self, async_client: AsyncClient, sample_driver: Driver
+    ):
+        """Test that Content-Range reports the total count, also past the last page."""
+        response = await async_client.get("/api/v1/drivers?range=[0,9]")
+        assert response.status_code == 200
+        assert response.headers["Content-Range"] == "0-9/1"
+
+        response = await async_client.get("/api/v1/drivers?range=[10,19]")
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers["Content-Range"] == "10-19/1"
+
+    @pytest.mark.asyncio
+    async def test_get_drivers_range_null_bounds(
+        self, async_client: AsyncClient, test_db_session
+    ):
+        """Test that a null range bound leaves that side of the page open."""
+        test_db_session.add_all(
+            Driver(id=uuid.uuid4(), name=f"Driver {i}", phone=f"+4790000{i:03d}") for i in range(3)
+        )
+        test_db_session.flush()
+
+        response = await async_client.get("/api/v1/drivers?range=[null,1]")
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert response.headers["Content-Range"] == "0-1/3"
+
+        response = await async_client.get("/api/v1/drivers?range=[1,null]")
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert response.headers["Content-Range"] == "1-2/3"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("range_", ["5", "[1,2,3]", '{"0":1,"1":2}'])
+    async def test_get_drivers_range_wrong_shape(self, async_client: AsyncClient, range_):
+        """Test that a range that is valid JSON but not [start, end] is rejected."""
+        response = await async_client.get(f"/api/v1/drivers?range={range_}")
+        assert response.status_code == 422
+        assert response.json()["detail"] == {
+            "range_model_validation_error": "Invalid range: range must be a list [start, end]"
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_drivers_range_negative(self, async_client: AsyncClient):
+        """Test that a negative range bound is reported by the range model."""
+        response = await async_client.get("/api/v1/drivers?range=[-1,9]")
+        assert response.status_code == 422
+        errors = response.json()["detail"]["range_model_validation_error"]
+        assert errors[0]["loc"] == ["start"]
+        assert "greater than or equal to 0" in errors[0]["msg"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort", ['"name"', '["name"]', '{"name":"ASC","x":1}'])
+    async def test_get_drivers_sort_wrong_shape(self, async_client: AsyncClient, sort):
+        """Test that a sort that is valid JSON but not [field, order] is rejected."""
+        response = await async_client.get(f"/api/v1/drivers?sort={sort}")
+        assert response.status_code == 422
+        assert response.json()["detail"] == {
+            "sort_model_validation_error": "sort must be a list [field_name, ASC/DESC]"
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_drivers_sort_invalid_order(self, async_client: AsyncClient):
+        """Test that an unknown sort order is reported by the sort model."""
+        response = await async_client.get('/api/v1/drivers?sort=["name","UP"]')
+        assert response.status_code == 422
+        errors = response.json()["detail"]["sort_model_validation_error"]
+        assert errors[0]["loc"] == ["order"]
+        assert "order must be 'ASC' or 'DESC'" in errors[0]["msg"]
+
+    @pytest.mark.asyncio
+    async def test_get_drivers_estimated_count(
+        self, async_client: AsyncClient, test_db_session, monkeypatch
+    ):
+        """Test that large unfiltered lists report the planner estimate as total."""
+        test_db_session.add_all(
+            Driver(id=uuid.uuid4(), name=f"Driver {i}", phone=f"+4790000{i:03d}") for i in range(5)
+        )
+        test_db_session.flush()
+        test_db_session.execute(text("ANALYZE drivers"))
+        # Added after ANALYZE, so only an exact count would include it
+        test_db_session.add(Driver(id=uuid.uuid4(), name="Late driver", phone="+4791000000"))
+        test_db_session.flush()
+        monkeypatch.setattr(DriverService, "EXACT_COUNT_THRESHOLD", 3)
+        _estimated_counts.clear()
+        try:
+            response = await async_client.get("/api/v1/drivers?range=[0,1]")
+            assert response.status_code == 200
+            assert len(response.json()) == 2
+            assert response.headers["Content-Range"] == "0-1/5"
+
+            # Filtered lists are still counted exactly
+            response = await async_client.get(
+                "/api/v1/drivers", params={"range": "[0,1]", "filter": '{"name": "Driver 1"}'}
+            )
+            assert response.headers["Content-Range"] == "0-1/1"
+        finally:
+            _estimated_counts.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_drivers_malformed_query_params(self, async_client: AsyncClient):
+        """Test that malformed filter and range parameters are rejected."""
+        response = await async_client.get("/api/v1/drivers", params={"filter": "{not json"})
+        assert response.status_code == 400
+
+        response = await async_client.get("/api/v1/drivers", params={"filter": '{"id": "not-a-uuid"}'})
+        assert response.status_code == 422
+        assert response.json()["detail"]["filter_model_validation_error"][0]["loc"] == ["id"]
+
+        response = await async_client.get("/api/v1/drivers", params={"range": "not json"})
+        assert response.status_code == 422
+
+        response = await async_client.get("/api/v1/drivers", params={"range": "[1]"})
+        assert response.status_code == 422
+
+        response = await async_client.get("/api/v1/drivers", params={"range": "[-1, 5]"})
+        assert response.status_code == 422
+
+        response = await async_client.get("/api/v1/drivers", params={"sort": '["name", "UP"]'})
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_get_drivers_sorting(self, async_client: AsyncClient, test_db_session):
+        """Test sorting drivers and ignoring fields that are not sortable."""
+        for name in ["Bravo", "Alpha", "Charlie"]:
+            test_db_session.add(Driver(name=name, phone="+100000000"))
+        test_db_session.flush()
+
+        response = await async_client.get("/api/v1/drivers", params={"sort": '["name", "DESC"]'})
+        assert response.status_code == 200
+        assert [driver["name"] for driver in response.json()] == ["Charlie", "Bravo", "Alpha"]
+
+        response = await async_client.get("/api/v1/drivers", params={"sort": '["unknown", "ASC"]'})
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+
     @pytest.mark.asyncio
     async def test_get_driver_by_id_success(
         self, async_client: AsyncClient, sample_driver: Driver
@@ -2,8 +2,12 @@ import pytest
 import uuid
 import os
 import io
+from datetime import datetime, timedelta
 from httpx import AsyncClient
-from app.database.models.orders import Order, OrderDocument, OrderDocumentType
+from sqlalchemy import null
+from sqlalchemy.exc import OperationalError
+from app.core.settings import settings
+from app.database.models.orders import Order, OrderDocument, OrderDocumentText, OrderDocumentType
 
 
 class TestOrderDocumentsAPI:
@@ -34,6 +38,37 @@ class TestOrderDocumentsAPI:
         assert data[0]["id"] == str(sample_order_document.id)
         assert data[0]["title"] == sample_order_document.title
 
+    @pytest.mark.asyncio
+    async def test_get_order_documents_newest_first(
+        self, async_client: AsyncClient, test_db_session, sample_order
+    ):
+        """Test that order documents are listed newest first by default."""
+        now = datetime.now()
+        # Documents stored before created_at had a default have no creation time;
+        # null() is needed since a plain None would let the server default apply
+        for created_at, title in [
+            (now - timedelta(days=2), "Oldest"),
+            (null(), "Undated"),
+            (now, "Newest"),
+            (now - timedelta(days=1), "Middle"),
+        ]:
+            test_db_session.add(
+                OrderDocument(
+                    order_id=sample_order.id,
+                    title=title,
+                    src=f"{title}.pdf",
+                    type=OrderDocumentType.Other,
+                    created_at=created_at,
+                )
+            )
+        test_db_session.flush()
+
+        response = await async_client.get(
+            f"/api/v1/orders/{sample_order.id}/documents/"
+        )
+        assert response.status_code == 200
+        assert [doc["title"] for doc in response.json()] == ["Newest", "Middle", "Oldest", "Undated"]
+
     @pytest.mark.asyncio
     async def test_get_order_document_by_id_success(
         self, async_client: AsyncClient, sample_order_document
@@ -74,6 +109,10 @@ class TestOrderDocumentsAPI:
             data=data,
         )
         assert response.status_code == 201
+        assert response.json()["mime_type"] == "application/pdf"
+        # The file is in place by the time the response names it
+        with open(response.json()["src"], "rb") as stored:
+            assert stored.read() == pdf_content
 
     @pytest.mark.asyncio
     async def test_upload_document_image(
@@ -92,6 +131,57 @@ class TestOrderDocumentsAPI:
         )
         assert response.status_code == 201
 
+    @pytest.mark.asyncio
+    async def test_upload_document_large_file_content(
+        self, async_client: AsyncClient, sample_order
+    ):
+        """Test that an upload spooled to disk is stored byte for byte."""
+        # Larger than Starlette's 1MB in-memory spool
+        pdf_content = b"%PDF-1.4\n" + bytes(range(256)) * 12_000
+        files = {"file": ("large.pdf", io.BytesIO(pdf_content), "application/pdf")}
+        data = {"title": "Large PDF", "type": "CMR"}
+
+        response = await async_client.post(
+            f"/api/v1/orders/{sample_order.id}/documents/",
+            files=files,
+            data=data,
+        )
+        assert response.status_code == 201
+        src = response.json()["src"]
+        assert os.path.basename(os.path.dirname(src)) == datetime.now().date().isoformat()
+        with open(src, "rb") as f:
+            assert f.read() == pdf_content
+
+    @pytest.mark.asyncio
+    async def test_upload_document_removed_when_commit_fails(
+        self, async_client: AsyncClient, test_db_session, sample_order, monkeypatch
+    ):
+        """Test that an upload whose transaction fails to commit leaves no file behind."""
+        documents_path = os.path.join(settings.FILES_PATH, "order_documents")
+
+        def stored_files():
+            return {
+                name
+                for _, _, names in os.walk(documents_path)
+                for name in names
+            }
+
+        existing_files = stored_files()
+
+        def failing_commit():
+            raise OperationalError("COMMIT", None, Exception("connection lost"))
+
+        monkeypatch.setattr(test_db_session, "commit", failing_commit)
+        # The test get_db does not map errors, so the failure reaches the client
+        with pytest.raises(OperationalError):
+            await async_client.post(
+                f"/api/v1/orders/{sample_order.id}/documents/",
+                files={"file": ("test.pdf", io.BytesIO(b"%PDF-1.4 fake pdf"), "application/pdf")},
+                data={"title": "Test PDF", "type": "Other"},
+            )
+
+        assert stored_files() == existing_files
+
     @pytest.mark.asyncio
     async def test_upload_document_unsupported_type(
         self, async_client: AsyncClient, sample_order
@@ -165,6 +255,11 @@ class TestOrderDocumentsAPI:
         result = response.json()
         assert result["created"] == 2
         assert len(result["documents"]) == 2
+        for document, content in zip(result["documents"], [pdf_content1, pdf_content2]):
+            assert document["id"]
+            assert document["created_at"]
+            with open(document["src"], "rb") as f:
+                assert f.read() == content
 
     @pytest.mark.asyncio
     async def test_download_document(
@@ -192,6 +287,163 @@ class TestOrderDocumentsAPI:
         # Document might not exist on filesystem in test environment
         assert response.status_code in [200, 404]
 
+    @pytest.mark.asyncio
+    async def test_download_document_file_content(
+        self, async_client: AsyncClient, test_db_session, sample_order, tmp_path
+    ):
+        """Test downloading a document that exists on disk returns its bytes."""
+        file_path = tmp_path / "stored.pdf"
+        file_content = b"%PDF-1.4\n" + b"x" * 200_000
+        file_path.write_bytes(file_content)
+        document = OrderDocument(
+            order_id=sample_order.id,
+            title="Invoice",
+            src=str(file_path),
+            type=OrderDocumentType.Other,
+        )
+        test_db_session.add(document)
+        test_db_session.flush()
+
+        response = await async_client.get(
+            f"/api/v1/orders/{sample_order.id}/documents/{document.id}/download"
+        )
+        assert response.status_code == 200
+        assert response.content == file_content
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-disposition"] == 'attachment; filename="Invoice.pdf"'
+
+        response = await async_client.get(
+            f"/api/v1/orders/{sample_order.id}/documents/{document.id}/view"
+        )
+        assert response.status_code == 200
+        assert response.content == file_content
+        assert "content-disposition" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_download_document_not_modified(
+        self, async_client: AsyncClient, test_db_session, sample_order, tmp_path
+    ):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        file_path = tmp_path / "stored.pdf"
+        file_path.write_bytes(b"%PDF-1.4 cached")
+        document = OrderDocument(
+            order_id=sample_order.id,
+            title="Invoice",
+            src=str(file_path),
+            type=OrderDocumentType.Other,
+        )
+        test_db_session.add(document)
+        test_db_session.flush()
+        url = f"/api/v1/orders/{sample_order.id}/documents/{document.id}/download"
+
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, max-age=60"
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = await async_client.get(url, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_download_document_after_title_update(
+        self, async_client: AsyncClient, test_db_session, sample_order, tmp_path
+    ):
+        """Test that updating a document is reflected in the next download."""
+        file_path = tmp_path / "stored.pdf"
+        file_path.write_bytes(b"%PDF-1.4 renamed")
+        document = OrderDocument(
+            order_id=sample_order.id,
+            title="Before",
+            src=str(file_path),
+            type=OrderDocumentType.Other,
+        )
+        test_db_session.add(document)
+        test_db_session.flush()
+        url = f"/api/v1/orders/{sample_order.id}/documents/{document.id}"
+
+        response = await async_client.get(f"{url}/download")
+        assert response.headers["content-disposition"] == 'attachment; filename="Before.pdf"'
+        etag = response.headers["etag"]
+
+        response = await async_client.patch(url, json={"title": "After"})
+        assert response.status_code == 200
+
+        # The file is unchanged, but the old ETag must not revalidate the old filename
+        response = await async_client.get(f"{url}/download", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["content-disposition"] == 'attachment; filename="After.pdf"'
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_download_document_xaccel_redirect(
+        self, async_client: AsyncClient, test_db_session, sample_order, monkeypatch
+    ):
+        """Test that USE_XACCEL delegates the file transfer to nginx."""
+        from app.core.settings import settings
+
+        monkeypatch.setattr(settings, "USE_XACCEL", True)
+        documents_dir = os.path.join(settings.FILES_PATH, "order_documents")
+        os.makedirs(documents_dir, exist_ok=True)
+        file_path = os.path.join(documents_dir, f"{uuid.uuid4()}_scan 1.pdf")
+        with open(file_path, "wb") as f:
+            f.write(b"%PDF-1.4 accel")
+        document = OrderDocument(
+            order_id=sample_order.id,
+            title="Scan",
+            src=file_path,
+            type=OrderDocumentType.Other,
+        )
+        test_db_session.add(document)
+        test_db_session.flush()
+
+        response = await async_client.get(
+            f"/api/v1/orders/{sample_order.id}/documents/{document.id}/download"
+        )
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["x-accel-redirect"] == (
+            "/_protected_files/order_documents/" + os.path.basename(file_path).replace(" ", "%20")
+        )
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-disposition"] == 'attachment; filename="Scan.pdf"'
+        etag = response.headers["etag"]
+
+        response = await async_client.get(
+            f"/api/v1/orders/{sample_order.id}/documents/{document.id}/download",
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_view_document_range_request(
+        self, async_client: AsyncClient, test_db_session, sample_order, tmp_path
+    ):
+        """Test that view serves partial content for Range requests."""
+        file_path = tmp_path / "stored.pdf"
+        file_content = bytes(range(256)) * 16
+        file_path.write_bytes(file_content)
+        document = OrderDocument(
+            order_id=sample_order.id,
+            title="Scan",
+            src=str(file_path),
+            type=OrderDocumentType.Other,
+        )
+        test_db_session.add(document)
+        test_db_session.flush()
+
+        response = await async_client.get(
+            f"/api/v1/orders/{sample_order.id}/documents/{document.id}/view",
+            headers={"Range": "bytes=100-199"},
+        )
+        assert response.status_code == 206
+        assert response.content == file_content[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(file_content)}"
+
     @pytest.mark.asyncio
     async def test_update_document_metadata(
         self, async_client: AsyncClient, sample_order_document
@@ -207,6 +459,20 @@ class TestOrderDocumentsAPI:
         data = response.json()
         assert data["title"] == update_data["title"]
 
+    @pytest.mark.asyncio
+    async def test_update_document_metadata_omitted_fields_untouched(
+        self, async_client: AsyncClient, sample_order_document
+    ):
+        """Test that PUT leaves fields missing from the body unchanged."""
+        response = await async_client.put(
+            f"/api/v1/orders/{sample_order_document.order_id}/documents/{sample_order_document.id}",
+            json={"title": "Only Title"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == "Only Title"
+        assert data["type"] == sample_order_document.type.value
+
     @pytest.mark.asyncio
     async def test_patch_document_metadata(
         self, async_client: AsyncClient, sample_order_document
@@ -238,6 +504,47 @@ class TestOrderDocumentsAPI:
         )
         assert get_response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_delete_document_removes_file_and_text(
+        self, async_client: AsyncClient, sample_order, test_db_session
+    ):
+        """Test that deleting a document removes its stored file and its text row."""
+        files = {"file": ("test.pdf", io.BytesIO(b"%PDF-1.4 fake pdf"), "application/pdf")}
+        response = await async_client.post(
+            f"/api/v1/orders/{sample_order.id}/documents/",
+            files=files,
+            data={"title": "Test PDF", "type": "Other"},
+        )
+        assert response.status_code == 201
+        document = response.json()
+        test_db_session.add(
+            OrderDocumentText(
+                order_document_id=uuid.UUID(document["id"]),
+                order_id=sample_order.id,
+                text="parsed",
+                order_created_at=datetime.now(),
+            )
+        )
+        test_db_session.commit()
+
+        response = await async_client.delete(
+            f"/api/v1/orders/{sample_order.id}/documents/{document['id']}"
+        )
+        assert response.status_code == 204
+        assert not os.path.exists(document["src"])
+        test_db_session.expire_all()
+        assert test_db_session.get(OrderDocumentText, uuid.UUID(document["id"])) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_document_not_found(
+        self, async_client: AsyncClient, sample_order
+    ):
+        """Test deleting a document that does not exist."""
+        response = await async_client.delete(
+            f"/api/v1/orders/{sample_order.id}/documents/{uuid.uuid4()}"
+        )
+        assert response.status_code == 404
+
     @pytest.mark.asyncio
     async def test_upload_document_invalid_order_id(
         self, async_client: AsyncClient
@@ -326,7 +633,16 @@ class TestOrderDocumentsAPI:
         )
         assert response.status_code == 200
         documents = response.json()
-        assert len(documents) <= 10
+        assert len(documents) == 10
+        assert response.headers["Content-Range"].endswith("/15")
+
+        # A range past the end still reports the total
+        response = await async_client.get(
+            f"/api/v1/orders/{sample_order.id}/documents/?range=[20,29]"
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers["Content-Range"].endswith("/15")
 
     @pytest.mark.asyncio
     async def test_upload_webp_image(
@@ -30,6 +30,17 @@ class TestOrdersAPI:
         assert data[0]["service"] == sample_order.service.value
         assert data[0]["commodity"] == sample_order.commodity.value
 
+    @pytest.mark.asyncio
+    async def test_get_orders_documents_count(
+        self, async_client: AsyncClient, sample_order_document, multiple_orders
+    ):
+        """Test that each listed order reports its own number of documents."""
+        response = await async_client.get("/api/v1/orders", params={"range": "[0,99]"})
+        assert response.status_code == 200
+        counts = {order["id"]: order["documents_count"] for order in response.json()}
+        assert counts[str(sample_order_document.order_id)] == 1
+        assert all(counts[str(order.id)] == 0 for order in multiple_orders)
+
     @pytest.mark.asyncio
     async def test_get_orders_with_pagination(
         self, async_client: AsyncClient, multiple_orders
@@ -39,6 +50,7 @@ class TestOrdersAPI:
         assert response.status_code == 200
         data = response.json()
         assert len(data) <= 10
+        assert response.headers["Content-Range"].endswith(f"/{len(multiple_orders)}")
 
         # Test second page
         response = await async_client.get("/api/v1/orders?range=[5,9]")
@@ -46,6 +58,12 @@ class TestOrdersAPI:
         data = response.json()
         assert len(data) <= 5
 
+        # A page past the end still reports the total
+        response = await async_client.get("/api/v1/orders?range=[100,109]")
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers["Content-Range"].endswith(f"/{len(multiple_orders)}")
+
 
     @pytest.mark.asyncio
     async def test_get_orders_with_filtering(
@@ -86,6 +104,16 @@ class TestOrdersAPI:
         data = response.json()
         assert data["id"] == str(sample_order.id)
         assert data["reference"] == sample_order.reference
+        assert data["documents_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_order_by_id_documents_count(
+        self, async_client: AsyncClient, sample_order_document
+    ):
+        """Test that a single order reports its number of documents."""
+        response = await async_client.get(f"/api/v1/orders/{sample_order_document.order_id}")
+        assert response.status_code == 200
+        assert response.json()["documents_count"] == 1
 
     @pytest.mark.asyncio
     async def test_get_order_by_id_not_found(self, async_client: AsyncClient):
@@ -114,6 +142,18 @@ class TestOrdersAPI:
         assert data["service"] == order_data["service"]
         assert data["commodity"] == order_data["commodity"]
 
+    @pytest.mark.asyncio
+    async def test_create_order_omitted_priority_uses_default(
+        self, async_client: AsyncClient, sample_terminal, test_data_generator
+    ):
+        """Test that an omitted priority gets the column default."""
+        order_data = test_data_generator.valid_order_data(str(sample_terminal.id))
+        order_data.pop("priority", None)
+
+        response = await async_client.post("/api/v1/orders", json=order_data)
+        assert response.status_code == 200
+        assert response.json()["priority"] is False
+
     @pytest.mark.asyncio
     async def test_create_order_missing_required_fields(
         self, async_client: AsyncClient, test_data_generator
@@ -252,6 +292,83 @@ class TestOrdersAPI:
         # Other fields should remain unchanged
         assert data["boxes"] == sample_order.boxes
 
+    @pytest.mark.asyncio
+    async def test_patch_order_lowercases_vehicles(self, async_client: AsyncClient, sample_order):
+        """Test that patched truck and trailer names are stored lowercased."""
+        response = await async_client.patch(
+            f"/api/v1/orders/{sample_order.id}",
+            json={"eta_truck": "AB 12345", "etd_trailer": "TR-9"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["eta_truck"] == "ab 12345"
+        assert data["etd_trailer"] == "tr-9"
+
+    @pytest.mark.asyncio
+    async def test_patch_order_not_found_with_bad_reference(self, async_client: AsyncClient):
+        """Test that a missing order is reported before a bad reference."""
+        response = await async_client.patch(
+            f"/api/v1/orders/{uuid.uuid4()}", json={"eta_truck_id": str(uuid.uuid4())}
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_patch_order_nonexistent_foreign_key(
+        self, async_client: AsyncClient, sample_order, sample_driver
+    ):
+        """Test patching an order with a reference to a record that does not exist."""
+        patch_data = {
+            "eta_driver_id": str(sample_driver.id),
+            "eta_truck_id": str(uuid.uuid4()),
+        }
+
+        response = await async_client.patch(
+            f"/api/v1/orders/{sample_order.id}", json=patch_data
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid eta_truck_id: Truck does not exist"
+
+    @pytest.mark.asyncio
+    async def test_patch_order_shared_foreign_keys(
+        self, async_client: AsyncClient, sample_order, sample_driver
+    ):
+        """Test patching eta and etd fields that reference the same record."""
+        patch_data = {
+            "eta_driver_id": str(sample_driver.id),
+            "etd_driver_id": str(sample_driver.id),
+        }
+        response = await async_client.patch(
+            f"/api/v1/orders/{sample_order.id}", json=patch_data
+        )
+        assert response.status_code == 200
+        assert response.json()["etd_driver_id"] == str(sample_driver.id)
+
+        missing_truck_id = str(uuid.uuid4())
+        response = await async_client.patch(
+            f"/api/v1/orders/{sample_order.id}",
+            json={"eta_truck_id": missing_truck_id, "etd_truck_id": missing_truck_id},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid eta_truck_id: Truck does not exist"
+
+    @pytest.mark.asyncio
+    async def test_patch_order_existing_foreign_keys(
+        self, async_client: AsyncClient, sample_order, sample_driver, sample_truck
+    ):
+        """Test patching an order with references to existing records."""
+        patch_data = {
+            "eta_driver_id": str(sample_driver.id),
+            "eta_truck_id": str(sample_truck.id),
+        }
+
+        response = await async_client.patch(
+            f"/api/v1/orders/{sample_order.id}", json=patch_data
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["eta_driver_id"] == str(sample_driver.id)
+        assert data["eta_truck_id"] == str(sample_truck.id)
+
     @pytest.mark.asyncio
     async def test_update_order_not_found(self, async_client: AsyncClient):
         """Test updating a non-existent order."""
@@ -1,6 +1,8 @@
 import pytest
 import uuid
 from httpx import AsyncClient
+from app.api.terminals.schemas import ResponseTerminalSchema
+from app.api.terminals.service import TerminalService
 from app.database.models.terminals import Terminal
 
 
@@ -41,6 +43,23 @@ class TestTerminalsAPI:
         assert data["name"] == sample_terminal.name
         assert data["time_zone"] == sample_terminal.time_zone
 
+    def test_get_terminal_by_id_columns_cover_response(self):
+        """Test that the get_by_id projection selects every field the response reads."""
+        selected = {column.key for column in TerminalService.get_by_id_columns}
+        assert selected == set(ResponseTerminalSchema.model_fields)
+
+    @pytest.mark.asyncio
+    async def test_get_terminal_by_id_optional_fields(
+        self, async_client: AsyncClient, sample_terminal
+    ):
+        """Test that the projected detail response includes the optional columns."""
+        response = await async_client.get(f"/api/v1/terminals/{sample_terminal.id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["address"] == sample_terminal.address
+        assert data["short_name"] == sample_terminal.short_name
+        assert data["account_code"] == sample_terminal.account_code
+
     @pytest.mark.asyncio
     async def test_get_terminal_by_id_not_found(self, async_client: AsyncClient):
         """Test getting a non-existent terminal by ID."""
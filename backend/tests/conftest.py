@@ -124,11 +124,17 @@ async def async_client(test_db_session: Session) -> AsyncGenerator[AsyncClient,
         def add(self, obj):
             return self.sync_session.add(obj)
 
+        def add_all(self, objs):
+            return self.sync_session.add_all(objs)
+
         async def delete(self, obj):
             return self.sync_session.delete(obj)
 
-        async def execute(self, query):
-            return self.sync_session.execute(query)
+        async def get(self, model, ident):
+            return self.sync_session.get(model, ident)
+
+        async def execute(self, query, params=None):
+            return self.sync_session.execute(query, params)
 
         async def commit(self):
             return self.sync_session.commit()